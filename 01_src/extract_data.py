@@ -82,6 +82,26 @@ def parse_args():
         action='store_true',
         help='Skip writing to SQL Server'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of worker processes for parallel extraction (0: one per CPU core)'
+    )
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help='Use threads instead of processes for --workers'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Directory for caching parsed sheets between runs (cache files are unpickled, so use a trusted directory)'
+    )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Load SQL Server tables with bcp (requires bcpandas)'
+    )
     return parser.parse_args()
 
 def get_default_paths(extraction_type: str) -> dict:
@@ -164,11 +184,15 @@ def main():
         # Initialize the appropriate extractor
         extractor_info = EXTRACTORS[args.type]
         extractor = extractor_info['class'](config)
+        if args.cache_dir:
+            extractor.sheet_cache_dir = Path(args.cache_dir)
         
         # Process files
         results_df = extractor.process_files(
             directory_path=paths['input_dir'],
-            debug_limit=1 if args.debug else None
+            debug_limit=1 if args.debug else None,
+            max_workers=args.workers,
+            use_threads=args.threads
         )
         
         # Save results to CSV
@@ -183,7 +207,8 @@ def main():
                     df=results_df,
                     table_name=f"kindergarten_{args.type}",
                     sql_types=extractor_info['sql_types'],
-                    logger=logger
+                    logger=logger,
+                    use_bulk=args.bulk
                 )
             except Exception as e:
                 logger.error(f"Failed to write to SQL Server: {str(e)}")
@@ -30,11 +30,11 @@ class AnlagenverzeichnisExtractor(BaseExcelExtractor):
         self.logger.info(f"\nProcessing file: {file_path}")
         
         # Find the correct sheet
-        xl = pd.ExcelFile(str(file_path))
+        xl = self._open_workbook(file_path)
         sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
         
         # Read the Excel file
-        df = pd.read_excel(str(file_path), sheet_name=sheet_name, header=None)
+        df = self._parse_sheet(xl, file_path, sheet_name, header=None)
         self.logger.info(f"📊 Successfully read '{sheet_name}' sheet")
         
         # Find the header row using the marker
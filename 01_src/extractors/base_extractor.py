@@ -2,15 +2,81 @@
 Base class for Excel data extractors.
 """
 
+import hashlib
+import os
 from pathlib import Path
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 import traceback
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache, partial
+from openpyxl import load_workbook
 from utils.checkpoint_utils import handle_problematic_files
+from utils.excel_utils import EXCEL_ENGINE
+
+
+@lru_cache(maxsize=100_000, typed=True)
+def _normalize_text(text: str | float | None) -> str:
+    """Normalize text by removing extra whitespace and handling NaN values."""
+    if pd.isna(text):
+        return ''
+    return ' '.join(str(text).split())
+
+
+@lru_cache(maxsize=128)
+def _match_sheets(sheet_names: Tuple[str, ...], patterns: Tuple[str, ...]) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    Resolve sheet patterns against a workbook's sheet names.
+    
+    Workbooks built from the same template share their sheet names, so the
+    resolution is cached on the (sheet names, patterns) pair.
+    
+    Returns:
+        Tuple of the match type ('exact', 'fuzzy', 'pattern' or None) and the matching sheets
+    """
+    upper_patterns = [pattern.upper() for pattern in patterns]
+    upper_sheets = [sheet.upper() for sheet in sheet_names]
+    
+    # Step 1: Try exact matching first
+    for sheet, upper_sheet in zip(sheet_names, upper_sheets):
+        if upper_sheet in upper_patterns:
+            return 'exact', (sheet,)  # Return single exact match immediately
+    
+    # Step 2: If no exact match, try fuzzy matching with "Standortinformation"
+    if "Standortinformation" in patterns:
+        fuzzy_matches = tuple(
+            sheet for sheet, upper_sheet in zip(sheet_names, upper_sheets)
+            if "STANDORTINFORMATION" in upper_sheet
+        )
+        if fuzzy_matches:
+            return 'fuzzy', fuzzy_matches
+    
+    # Step 3: If still no match, try the original pattern matching
+    matching_sheets = tuple(
+        sheet
+        for sheet, upper_sheet in zip(sheet_names, upper_sheets)
+        for pattern in upper_patterns
+        if pattern in upper_sheet
+    )
+    if matching_sheets:
+        return 'pattern', matching_sheets
+    return None, ()
+
+
+def _extract_file(extractor: "BaseExcelExtractor", file_path: Path) -> Tuple[pd.DataFrame, List[Dict]]:
+    """Run extract_data in a worker process and hand back the issues it logged."""
+    df = extractor.extract_data(file_path)
+    return df, extractor.issues
+
 
 class BaseExcelExtractor:
+    SHEET_CACHE_MAX_FILES = 512  # Least recently used sheets beyond this are evicted
+    
     def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
         """
         Initialize the extractor.
@@ -22,14 +88,175 @@ class BaseExcelExtractor:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self.issues = []  # List to track all issues (errors and warnings)
+        self.sheet_cache_dir: Optional[Path] = None  # Set to cache parsed sheets on disk
+
+    def __getstate__(self) -> Dict:
+        """Pickle by logger name so extractors can be sent to worker processes."""
+        state = self.__dict__.copy()
+        state['logger'] = self.logger.name
+        state['issues'] = []  # Workers report their own issues back
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Re-attach the logger by name inside the worker process."""
+        state['logger'] = logging.getLogger(state['logger'])
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _open_workbook(file_path: str | Path) -> pd.ExcelFile:
+        """
+        Open an Excel workbook so it can be reused for sheet lookup and parsing.
+        
+        Uses calamine when available. Otherwise .xlsx/.xlsm files are opened with
+        openpyxl in read-only, values-only mode and other formats use pandas' default.
+        """
+        file_path = Path(file_path)
+        if EXCEL_ENGINE is None and file_path.suffix.lower() in ('.xlsx', '.xlsm'):
+            return pd.ExcelFile(
+                file_path,
+                engine='openpyxl',
+                engine_kwargs={'read_only': True, 'data_only': True, 'keep_links': False}
+            )
+        return pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
 
-    def _get_preview_data(self, file_path: str | Path, sheet_name: str, nrows: int = 100) -> pd.DataFrame:
-        """Get preview data from Excel file."""
+    def _parse_sheet(self, xl: pd.ExcelFile, file_path: str | Path, sheet_name: str, **kwargs) -> pd.DataFrame:
+        """
+        Parse a sheet, going through the on-disk sheet cache if sheet_cache_dir is set.
+        
+        Cache entries are keyed on the file's path and modification time, the reader
+        engine, the sheet and the parse arguments, so edited workbooks are re-parsed
+        automatically. Cache files are unpickled, so the directory must be trusted.
+        
+        Args:
+            xl: Opened workbook
+            file_path: Path to the Excel file
+            sheet_name: Sheet to parse
+            **kwargs: Further arguments for ExcelFile.parse
+            
+        Returns:
+            pd.DataFrame: Parsed sheet
+        """
+        if self.sheet_cache_dir is None:
+            return xl.parse(sheet_name=sheet_name, **kwargs)
+        
+        file_path = Path(file_path).resolve()
+        key = f"{file_path}:{file_path.stat().st_mtime_ns}:{xl.engine}:{sheet_name}:{sorted(kwargs.items())}"
+        cache_dir = Path(self.sheet_cache_dir)
+        cache_file = cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+        
+        if cache_file.exists():
+            try:
+                df = pd.read_pickle(cache_file)
+                os.utime(cache_file)  # Mark as recently used
+                self.logger.debug(f"Read sheet {sheet_name} of {file_path.name} from cache")
+                return df
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable cache file {cache_file}: {str(e)}")
+        
+        df = xl.parse(sheet_name=sheet_name, **kwargs)
+        # Write under a temporary name so parallel workers never read a partial file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
         try:
-            return pd.read_excel(str(file_path), sheet_name=sheet_name, nrows=nrows)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(tmp_file)
+            os.replace(tmp_file, cache_file)
+            self._trim_sheet_cache(cache_dir)
         except Exception as e:
-            self.logger.error(f"Error reading preview data: {str(e)}")
-            raise
+            # Caching is best effort; the parsed sheet is returned either way
+            self.logger.warning(f"Could not write sheet cache {cache_file}: {str(e)}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+        return df
+
+    def _trim_sheet_cache(self, cache_dir: Path) -> None:
+        """Evict the least recently used cache files beyond SHEET_CACHE_MAX_FILES."""
+        cache_files = list(cache_dir.glob("*.pkl"))
+        if len(cache_files) <= self.SHEET_CACHE_MAX_FILES:
+            return
+        cache_files.sort(key=lambda f: f.stat().st_mtime)
+        for cache_file in cache_files[:len(cache_files) - self.SHEET_CACHE_MAX_FILES]:
+            cache_file.unlink(missing_ok=True)
+
+    def _read_matching_sheet(self, file_path: str | Path) -> pd.DataFrame:
+        """
+        Read the sheet matching the configured sheet_patterns without a header row.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            pd.DataFrame: Raw sheet contents
+            
+        Raises:
+            ValueError: If no sheet matches the patterns
+        """
+        xl = self._open_workbook(file_path)
+        self.logger.debug(f"Available sheets: {xl.sheet_names}")
+        sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
+        self.logger.info(f"Found sheet: {sheet_name}")
+        
+        if sheet_name is None:
+            raise ValueError(f"No sheet matching patterns found in {file_path}")
+        
+        df = self._parse_sheet(xl, file_path, sheet_name, header=None)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"DataFrame shape: {df.shape}")
+            self.logger.debug("First few rows of data:")
+            self.logger.debug(df.head(10).to_string())
+        return df
+
+    def _scan_for_marker(
+        self,
+        file_path: str | Path,
+        sheet_name: str,
+        marker: str,
+        min_row: int = 1,
+        max_row: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Stream a sheet with openpyxl and return the first row containing marker.
+        
+        Stops at the first match, without building a DataFrame. Files openpyxl cannot
+        read (e.g. .xls) are scanned from a pandas read of the same rows instead.
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Name of the sheet to scan
+            marker: Text to look for (case-insensitive)
+            min_row: First 1-based row to scan
+            max_row: Last 1-based row to scan (optional)
+            
+        Returns:
+            Optional[int]: 0-based sheet row of the match, or None if not found
+        """
+        marker = str(marker).upper()
+        if Path(file_path).suffix.lower() not in ('.xlsx', '.xlsm'):
+            rows = pd.read_excel(
+                file_path,
+                sheet_name=sheet_name,
+                header=None,
+                skiprows=min_row - 1,
+                nrows=None if max_row is None else max_row - min_row + 1,
+                engine=EXCEL_ENGINE
+            ).itertuples(index=False, name=None)
+            for row_idx, values in enumerate(rows, min_row - 1):
+                if any(isinstance(val, str) and marker in val.upper() for val in values):
+                    return row_idx
+            return None
+        
+        wb = load_workbook(str(file_path), read_only=True, data_only=True)
+        try:
+            ws = wb[sheet_name]
+            for row_idx, values in enumerate(
+                ws.iter_rows(min_row=min_row, max_row=max_row, values_only=True), min_row - 1
+            ):
+                if any(isinstance(val, str) and marker in val.upper() for val in values):
+                    return row_idx
+            return None
+        finally:
+            wb.close()
 
     def _log_issue(self, file_path: Path | str, issue_type: str, message: str, details: Optional[Dict] = None) -> None:
         """
@@ -83,16 +310,26 @@ class BaseExcelExtractor:
         directory_path: str | Path,
         file_pattern: str = "*.xlsx",
         checkpoint_file: Optional[str | Path] = None,
-        debug_limit: Optional[int] = None
+        debug_limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_threads: bool = False
     ) -> pd.DataFrame:
         """
         Process multiple Excel files in a directory.
         
+        Files are independent, so with max_workers > 1 they are extracted in a
+        process pool. With use_threads a thread pool is used instead: it skips
+        process start-up and pickling, but only overlaps file I/O and decompression,
+        so it suits I/O-bound batches (e.g. files on a network share).
+        
         Args:
             directory_path: Path to directory containing Excel files
             file_pattern: Pattern to match Excel files
             checkpoint_file: Path to checkpoint file (optional)
             debug_limit: Limit number of files to process (optional)
+            max_workers: Number of worker processes (optional, default: sequential;
+                0 uses one process per CPU core)
+            use_threads: Use a thread pool instead of a process pool (optional)
             
         Returns:
             pd.DataFrame: Combined results from all processed files
@@ -118,17 +355,23 @@ class BaseExcelExtractor:
             
             all_results = []
             
-            for idx, file_path in enumerate(file_paths, 1):
-                try:
-                    self.logger.info(f"Processing file [{idx}/{total_files}]: {file_path.name}")
-                    df = self.extract_data(file_path)
-                    if len(df) > 0:
-                        all_results.append(df)
-                        self.logger.info(f"Successfully extracted {len(df)} rows from {file_path.name}")
-                    else:
-                        self._log_issue(file_path, 'NO_DATA', 'No data was extracted from this file')
-                except Exception as e:
-                    self._handle_processing_error(file_path, e)
+            if max_workers == 0:
+                max_workers = os.cpu_count()
+            use_pool = max_workers is not None and max_workers > 1
+            pool = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+            with pool(max_workers=max_workers) if use_pool else nullcontext() as executor:
+                extractions = self._schedule_extractions(file_paths, executor)
+                for idx, (file_path, extract) in enumerate(zip(file_paths, extractions), 1):
+                    try:
+                        self.logger.info(f"Processing file [{idx}/{total_files}]: {file_path.name}")
+                        df = extract()
+                        if len(df) > 0:
+                            all_results.append(df)
+                            self.logger.info(f"Successfully extracted {len(df)} rows from {file_path.name}")
+                        else:
+                            self._log_issue(file_path, 'NO_DATA', 'No data was extracted from this file')
+                    except Exception as e:
+                        self._handle_processing_error(file_path, e)
             
             # Handle problematic files using the existing utility
             if self.issues:
@@ -157,6 +400,8 @@ class BaseExcelExtractor:
                 raise ValueError("No files were successfully processed")
             
             final_df = pd.concat(all_results, ignore_index=True)
+            # source_file is constant per file, so store each name only once
+            final_df['source_file'] = final_df['source_file'].astype('category')
             self.logger.info(f"\nProcessing complete!")
             self.logger.info(f"Successfully processed: {final_df['source_file'].nunique()}/{total_files} files")
             self.logger.info(f"Total records extracted: {len(final_df)}")
@@ -167,43 +412,54 @@ class BaseExcelExtractor:
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             raise
 
+    def _schedule_extractions(
+        self,
+        file_paths: List[Path],
+        executor: Optional[Executor]
+    ) -> List[Callable[[], pd.DataFrame]]:
+        """
+        Prepare one extraction callable per file, submitting them to executor if given.
+        
+        Args:
+            file_paths: Files to extract
+            executor: Process or thread pool to run the extractions in (optional)
+            
+        Returns:
+            List of callables returning each file's DataFrame, in file order
+        """
+        if executor is None:
+            return [partial(self.extract_data, file_path) for file_path in file_paths]
+        if isinstance(executor, ThreadPoolExecutor):
+            # Threads share this extractor, so issues are logged to it directly
+            return [executor.submit(self.extract_data, file_path).result for file_path in file_paths]
+        futures = [executor.submit(_extract_file, self, file_path) for file_path in file_paths]
+        return [partial(self._collect_extraction, future) for future in futures]
+
+    def _collect_extraction(self, future: Future) -> pd.DataFrame:
+        """Wait for a worker's result and merge the issues it logged."""
+        df, issues = future.result()
+        self.issues.extend(issues)
+        return df
+
     def _find_matching_sheet(self, xl: pd.ExcelFile, patterns: List[str]) -> List[str]:
         """
         Find sheet names matching the patterns, using exact match first, then fuzzy match.
         Returns a list of matching sheets.
         """
         try:
-            matching_sheets = []
-            
-            # Step 1: Try exact matching first
-            for sheet in xl.sheet_names:
-                for pattern in patterns:
-                    if str(sheet).upper() == str(pattern).upper():
-                        self.logger.info(f"Found exact match for sheet: {sheet}")
-                        return [sheet]  # Return single exact match immediately
-            
-            # Step 2: If no exact match, try fuzzy matching with "Standortinformation"
-            if "Standortinformation" in patterns:
-                fuzzy_matches = []
-                for sheet in xl.sheet_names:
-                    if "Standortinformation".upper() in str(sheet).upper():
-                        fuzzy_matches.append(sheet)
-                
-                if fuzzy_matches:
-                    self.logger.info(f"Found fuzzy match(es) for Standortinformation: {fuzzy_matches}")
-                    return fuzzy_matches
-            
-            # Step 3: If still no match, try the original pattern matching
-            for sheet in xl.sheet_names:
-                for pattern in patterns:
-                    if str(pattern).upper() in str(sheet).upper():
-                        matching_sheets.append(sheet)
-            
-            if matching_sheets:
-                self.logger.info(f"Found pattern match(es) for sheets: {matching_sheets}")
-                return matching_sheets
-            
-            raise ValueError(f"No sheet matching patterns {patterns}")
+            match_type, matching_sheets = _match_sheets(
+                tuple(str(sheet) for sheet in xl.sheet_names),
+                tuple(str(pattern) for pattern in patterns)
+            )
+            if match_type == 'exact':
+                self.logger.info(f"Found exact match for sheet: {matching_sheets[0]}")
+            elif match_type == 'fuzzy':
+                self.logger.info(f"Found fuzzy match(es) for Standortinformation: {list(matching_sheets)}")
+            elif match_type == 'pattern':
+                self.logger.info(f"Found pattern match(es) for sheets: {list(matching_sheets)}")
+            else:
+                raise ValueError(f"No sheet matching patterns {patterns}")
+            return list(matching_sheets)
         except Exception as e:
             self.logger.error(f"Error finding matching sheet: {str(e)}")
             raise
@@ -211,52 +467,139 @@ class BaseExcelExtractor:
     @staticmethod
     def _normalize_text(text: str | float | None) -> str:
         """Normalize text by removing extra whitespace and handling NaN values."""
-        if pd.isna(text):
-            return ''
-        return ' '.join(str(text).split())
+        try:
+            return _normalize_text(text)
+        except TypeError:
+            # Unhashable values cannot go through the cache
+            return _normalize_text.__wrapped__(text)
+
+    @staticmethod
+    def _text_array(window: np.ndarray, to_text: Callable) -> np.ndarray:
+        """Convert a block of cells to a NumPy string array, with '' for missing cells."""
+        texts = [[to_text(val) if pd.notna(val) else '' for val in row] for row in window]
+        return np.array(texts, dtype=str).reshape(window.shape)
+
+    @staticmethod
+    def _clean_cells(values: np.ndarray) -> np.ndarray:
+        """
+        Strip every cell of a block to its text, with '' for missing cells.
+        
+        Returns an object array so each cell keeps its own length; a fixed-width
+        NumPy string array would pad every cell to the longest one in the sheet.
+        """
+        clean = np.frompyfunc(lambda val: '' if pd.isna(val) else str(val).strip(), 1, 1)
+        return clean(values)
+
+    @staticmethod
+    def _first_row_index(cells: np.ndarray) -> Dict[str, int]:
+        """
+        Map each distinct cell text to the row of its first occurrence, column by column.
+        
+        Args:
+            cells: 2-D array of cleaned cell strings
+            
+        Returns:
+            Dict mapping cell text to its row position
+        """
+        flat = cells.T.ravel()
+        if flat.size == 0:
+            return {}
+        texts, first = np.unique(flat, return_index=True)
+        return dict(zip(texts.tolist(), (first % cells.shape[0]).tolist()))
+
+    @staticmethod
+    def _rows_containing(df: pd.DataFrame, text: str) -> np.ndarray:
+        """Boolean mask of the rows holding a cell whose string form contains text."""
+        contains = np.frompyfunc(lambda val: text in str(val), 1, 1)
+        return contains(df.to_numpy(dtype=object)).astype(bool).any(axis=1)
 
     def _find_section_start(self, df: pd.DataFrame, marker: str) -> Optional[int]:
         """Find the row index where a section starts."""
         try:
-            for idx, row in df.iterrows():
-                if any(isinstance(val, str) and str(marker).upper() in str(val).upper() 
-                       for val in row.values if pd.notna(val)):
-                    return idx
-            return None
+            marker = str(marker).upper()
+            text_cols = [
+                col_idx for col_idx, dtype in enumerate(df.dtypes)
+                if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            ]
+            # One pass over the text columns; non-string cells never match
+            contains = np.frompyfunc(lambda val: isinstance(val, str) and marker in val.upper(), 1, 1)
+            cells = df.iloc[:, text_cols].to_numpy(dtype=object)
+            mask = contains(cells).astype(bool).any(axis=1)
+            if not mask.any():
+                return None
+            return df.index[mask.argmax()]
         except Exception as e:
             self.logger.error(f"Error finding section start: {str(e)}")
             return None
 
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _normalize_text over every cell of a DataFrame."""
+        return (
+            df.astype("string")
+            .apply(lambda s: s.str.replace(r"\s+", " ", regex=True).str.strip())
+            .fillna('')
+        )
+
+    def _normalize_preview(self, df: pd.DataFrame) -> Tuple[np.ndarray, Dict[str, List[Tuple]]]:
+        """
+        Normalize a DataFrame once and index its cells by normalized text.
+        
+        Args:
+            df: DataFrame to index
+            
+        Returns:
+            Tuple of the normalized cell array and a dict mapping each non-empty
+            normalized text to its (row label, column position) pairs, column by column
+        """
+        normalized = self._normalize_frame(df).to_numpy(dtype=object)
+        # Only visit non-empty cells; transposing keeps the column-major order
+        col_idx, row_pos = np.nonzero(normalized.T != '')
+        row_labels = df.index[row_pos]
+        index = defaultdict(list)
+        for text, row, col in zip(normalized[row_pos, col_idx], row_labels, col_idx.tolist()):
+            index[text].append((row, col))
+        return normalized, dict(index)
+
     def _find_category_position(
         self,
         df: pd.DataFrame,
         category: str,
-        log_partial_matches: bool = True
+        log_partial_matches: bool = True,
+        preview: Optional[Tuple[np.ndarray, Dict[str, List[Tuple]]]] = None
     ) -> Tuple[Optional[int], Optional[int]]:
-        """Find the position (row and column) of a category in the DataFrame."""
-        normalized_category = self._normalize_text(category)
+        """
+        Find the position (row and column) of a category in the DataFrame.
         
-        for col in df.columns:
-            mask = df[col].apply(self._normalize_text) == normalized_category
-            if mask.any():
-                return mask.idxmax(), df.columns.get_loc(col)
+        Pass the result of _normalize_preview as preview to reuse it across lookups.
+        """
+        if preview is None:
+            preview = self._normalize_preview(df)
+        positions = preview[1].get(self._normalize_text(category))
+        if positions:
+            return positions[0]
         
         if log_partial_matches:
-            self._log_partial_matches(df, category)
+            self._log_partial_matches(df, category, preview)
                 
         return None, None
 
-    def _log_partial_matches(self, df: pd.DataFrame, category: str) -> None:
+    def _log_partial_matches(
+        self,
+        df: pd.DataFrame,
+        category: str,
+        preview: Optional[Tuple[np.ndarray, Dict[str, List[Tuple]]]] = None
+    ) -> None:
         """Log partial matches for debugging purposes."""
         normalized_category = self._normalize_text(category)
         self.logger.info("No exact match found, looking for partial matches:")
         
-        for idx, row in df.iterrows():
-            for col in df.columns:
-                val = row[col]
-                normalized_val = self._normalize_text(val)
-                if normalized_val and (normalized_category in normalized_val or normalized_val in normalized_category):
-                    self.logger.info(f"Found partial match at row {idx}, col {col}: '{normalized_val}'")
+        if preview is None:
+            preview = self._normalize_preview(df)
+        for normalized_val, positions in preview[1].items():
+            if normalized_category in normalized_val or normalized_val in normalized_category:
+                for idx, col_idx in positions:
+                    self.logger.info(f"Found partial match at row {idx}, col {df.columns[col_idx]}: '{normalized_val}'")
 
     def validate_config_sections(self, required_sections: List[str]) -> None:
         """Validate that required sections exist in config."""
@@ -292,7 +635,7 @@ class BaseExcelExtractor:
         """
         try:
             file_path = Path(file_path)
-            xl = pd.ExcelFile(file_path)
+            xl = self._open_workbook(file_path)
             
             # Find matching sheets
             matching_sheets = self._find_matching_sheet(xl, self.config['sheet_patterns'])
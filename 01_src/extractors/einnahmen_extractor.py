@@ -3,6 +3,7 @@ Concrete implementation of Excel extractor for Einnahmen (income) data.
 """
 
 from pathlib import Path
+import logging
 import pandas as pd
 from .base_extractor import BaseExcelExtractor
 from utils import find_sheet_with_content, extract_section_data
@@ -46,20 +47,7 @@ class EinnahmenExtractor(BaseExcelExtractor):
         """
         self.logger.info(f"\nProcessing file: {file_path}")
         
-        # Find the correct sheet
-        xl = pd.ExcelFile(file_path)
-        self.logger.debug(f"Available sheets: {xl.sheet_names}")
-        sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
-        self.logger.info(f"Found sheet: {sheet_name}")
-        
-        if sheet_name is None:
-            raise ValueError(f"No sheet matching patterns found in {file_path}")
-        
-        # Read the sheet
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
-        self.logger.debug(f"DataFrame shape: {df.shape}")
-        self.logger.debug("First few rows of data:")
-        self.logger.debug(df.head(10).to_string())
+        df = self._read_matching_sheet(file_path)
         
         try:
             # Try different section identifiers from config
@@ -93,9 +81,10 @@ class EinnahmenExtractor(BaseExcelExtractor):
             # Ensure output columns are in the correct order
             result = result[self.config['output_columns']]
             
-            self.logger.debug(f"Extracted {len(result)} rows")
-            self.logger.debug("Extracted data:")
-            self.logger.debug(result.head().to_string())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Extracted {len(result)} rows")
+                self.logger.debug("Extracted data:")
+                self.logger.debug(result.head().to_string())
             return result
         except Exception as e:
             self.logger.error(f"Error in extract_section_data: {str(e)}")
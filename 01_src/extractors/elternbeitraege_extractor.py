@@ -4,17 +4,19 @@ Concrete implementation of Excel extractor for Elternbeiträge (parent contribut
 
 from pathlib import Path
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import numpy as np
 import logging
 
 from .base_extractor import BaseExcelExtractor
+from utils.excel_utils import EXCEL_ENGINE
 
 class ElternbeitraegeExtractor(BaseExcelExtractor):
     def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
         super().__init__(config, logger)
         # Validate config structure at initialization
         self.validate_config_sections(['verpflegung_structure', 'zusatzleistungen_structure', 'section_markers'])
+        self._verpflegung_types = frozenset(self.config['verpflegung_structure']['Verpflegung:'])
 
     def process_sheet(self, file_path: Path, sheet_name: str) -> pd.DataFrame:
         """
@@ -29,9 +31,11 @@ class ElternbeitraegeExtractor(BaseExcelExtractor):
         """
         self.logger.info(f"Processing sheet {sheet_name} from {file_path}")
         
-        # Find the starting row containing "KINDERGÄRTEN UND KINDERGRUPPEN"
-        preview_df = self._get_preview_data(file_path, sheet_name)
-        start_row = self._find_section_start(preview_df, self.config['section_markers'][0])
+        # Find the starting row containing "KINDERGÄRTEN UND KINDERGRUPPEN",
+        # scanning the 100 rows below the sheet's header row
+        start_row = self._scan_for_marker(
+            file_path, sheet_name, self.config['section_markers'][0], min_row=2, max_row=101
+        )
         
         if start_row is None:
             self.logger.warning(f"Could not find section start marker in sheet {sheet_name}")
@@ -41,9 +45,10 @@ class ElternbeitraegeExtractor(BaseExcelExtractor):
         df = pd.read_excel(
             file_path,
             sheet_name=sheet_name,
-            skiprows=start_row + 2,  # Skip the section header and column headers
+            skiprows=start_row + 1,  # Skip up to the section header; the column headers become the header row
             nrows=30,  # Read enough rows to capture all entries
-            usecols="A:G"
+            usecols="A:G",
+            engine=EXCEL_ENGINE
         )
         
         # Extract data from each section
@@ -54,30 +59,23 @@ class ElternbeitraegeExtractor(BaseExcelExtractor):
         # Create DataFrame from collected data
         result_df = pd.DataFrame(data)
         
-        # Clean up the data
-        result_df = result_df.replace({np.nan: None})
+        # Clean up the data - only the value columns can hold NaN
+        value_cols = result_df.columns.intersection(['amount', 'frequency'])
+        result_df[value_cols] = result_df[value_cols].astype(object).where(result_df[value_cols].notna(), None)
         result_df['source_file'] = Path(file_path).stem
         
         self.logger.info(f"Extracted {len(result_df)} rows from sheet {sheet_name}")
         return result_df
     
-    def _find_section_start(self, df: pd.DataFrame, marker: str) -> Optional[int]:
-        """Find the row index where a section starts."""
-        for idx, row in df.iterrows():
-            if any(isinstance(val, str) and marker.upper() in str(val).upper() 
-                   for val in row.values if pd.notna(val)):
-                return idx
-        return None
-    
     def _extract_section_data(self, df: pd.DataFrame, category: str, section_start_marker: Optional[str] = None, 
-                            valid_types: Optional[List[str]] = None, section_end_marker: Optional[str] = None) -> List[Dict]:
+                            valid_types: Optional[FrozenSet[str]] = None, section_end_marker: Optional[str] = None) -> List[Dict]:
         """Generic method to extract data from a section.
         
         Args:
             df: DataFrame containing the data
             category: Category name for the extracted data
             section_start_marker: Optional marker to find the section start
-            valid_types: List of valid types for this category
+            valid_types: Set of valid types for this category
             section_end_marker: Optional marker to find the section end
             
         Returns:
@@ -93,10 +91,16 @@ class ElternbeitraegeExtractor(BaseExcelExtractor):
                 return data
             start_idx = start_indices[0] + 1
         
+        # Resolve the value columns once - named if present, positional otherwise
+        amount_header = 'Betrag in EUR'
+        frequency_header = 'Anzahl pro Jahr\n(z.B. 12 mal)'
+        type_col = df.iloc[:, 0]
+        amount_col = df[amount_header] if amount_header in df.columns else df.iloc[:, 2]
+        frequency_col = df[frequency_header] if frequency_header in df.columns else df.iloc[:, 3]
+        
         # Process each row
         for idx in range(start_idx, len(df)):
-            row = df.iloc[idx]
-            entry_type = row.iloc[0]
+            entry_type = type_col.iat[idx]
             
             if pd.isna(entry_type):
                 continue
@@ -114,19 +118,18 @@ class ElternbeitraegeExtractor(BaseExcelExtractor):
             data.append({
                 'category': category,
                 'type': entry_type,
-                'amount': row['Betrag in EUR'] if 'Betrag in EUR' in row.index else row.iloc[2],
-                'frequency': row['Anzahl pro Jahr\n(z.B. 12 mal)'] if 'Anzahl pro Jahr\n(z.B. 12 mal)' in row.index else row.iloc[3]
+                'amount': amount_col.iat[idx],
+                'frequency': frequency_col.iat[idx]
             })
         
         return data
     
     def _extract_verpflegung(self, df: pd.DataFrame) -> List[Dict]:
         """Extract Verpflegung (catering) related entries."""
-        verpflegung_types = self.config['verpflegung_structure']['Verpflegung:']
         return self._extract_section_data(
             df, 
             category='Verpflegung',
-            valid_types=verpflegung_types
+            valid_types=self._verpflegung_types
         )
     
     def _extract_zusatzleistungen(self, df: pd.DataFrame) -> List[Dict]:
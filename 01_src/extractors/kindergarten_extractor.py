@@ -4,12 +4,50 @@ Concrete implementation of Excel extractor for kindergarten data.
 
 from pathlib import Path
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+import numpy as np
+from typing import List, Dict, FrozenSet, Optional, Tuple
+import logging
 import traceback
 
 from .base_extractor import BaseExcelExtractor
 
 class KindergartenExcelExtractor(BaseExcelExtractor):
+    SECTIONS = ['section_a_structure', 'section_b_structure']
+    VALUE_COLUMNS = ['category', 'subcategory', 'value_2022', 'value_2023', 'abweichung']
+    
+    def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
+        super().__init__(config, logger)
+        # Compile the subcategory lookup tables once instead of per file
+        self._section_lookups = {
+            section_name: self._build_lookup(config[section_name])
+            for section_name in self.SECTIONS
+            if section_name in config
+        }
+        self._lookup_keys = frozenset(
+            key for lookup in self._section_lookups.values() for key in lookup['key']
+        )
+    
+    def _build_lookup(self, structure: Dict) -> pd.DataFrame:
+        """
+        Build a lookup table of all (category, subcategory) pairs in structure order.
+        
+        Args:
+            structure: Dictionary defining the data structure to look for
+            
+        Returns:
+            pd.DataFrame: Lookup table with category, subcategory, key and order columns
+        """
+        lookup_rows = []
+        for main_category, subcategories in structure.items():
+            if not isinstance(subcategories, (list, tuple)):
+                self.logger.error(f"Invalid subcategories format for {main_category}: {type(subcategories)}")
+                continue
+            for subcategory in subcategories:
+                lookup_rows.append((str(main_category), str(subcategory), str(subcategory).strip()))
+        lookup = pd.DataFrame(lookup_rows, columns=['category', 'subcategory', 'key'])
+        lookup['order'] = range(len(lookup))
+        return lookup
+    
     def extract_data(self, file_path: str | Path) -> pd.DataFrame:
         """
         Extract kindergarten data from Excel file.
@@ -25,11 +63,11 @@ class KindergartenExcelExtractor(BaseExcelExtractor):
             self.logger.info(f"Starting data extraction from {file_path}")
             
             # Validate config structure
-            self.validate_config_sections(['section_a_structure', 'section_b_structure'])
+            self.validate_config_sections(self.SECTIONS)
             
             # Find the correct sheet
             self.logger.debug(f"Opening Excel file: {str(file_path)}")
-            xl = pd.ExcelFile(str(file_path))
+            xl = self._open_workbook(file_path)
             matching_sheets = self._find_matching_sheet(xl, self.config['sheet_patterns'])
             
             if not matching_sheets:
@@ -39,27 +77,34 @@ class KindergartenExcelExtractor(BaseExcelExtractor):
             sheet_name = matching_sheets[0]
             self.logger.debug(f"Using sheet: {sheet_name}")
             
-            # Read the entire sheet
+            # Read the entire sheet through the already opened workbook
             self.logger.debug(f"Reading sheet {sheet_name} from {str(file_path)}")
-            df = pd.read_excel(str(file_path), sheet_name=sheet_name)
+            df = self._parse_sheet(xl, file_path, sheet_name)
             self.logger.debug(f"DataFrame shape: {df.shape}")
             
-            # Extract sections
-            sections_data = []
-            for section_name in ['section_a_structure', 'section_b_structure']:
+            # Resolve the cells naming any section's subcategory in one pass and share them
+            positions = self._cell_positions(df, self._lookup_keys)
+            
+            # Extract sections into shared column lists
+            columns = {name: [] for name in self.VALUE_COLUMNS}
+            for section_name in self.SECTIONS:
                 self.logger.debug(f"Processing section: {section_name}")
                 structure = self.config[section_name]
-                self.logger.debug(f"Structure: {structure}")
-                section_data = self._extract_section(df.copy(), structure, file_path)
-                sections_data.append(section_data)
-                self.logger.info(f"{section_name} extracted, got {len(section_data)} rows")
+                self.logger.debug("Structure: %s", structure)
+                section_columns = self._extract_section(
+                    df, structure, file_path, self._section_lookups.get(section_name), positions
+                )
+                for name, values in section_columns.items():
+                    columns[name].extend(values)
+                self.logger.info(f"{section_name} extracted, got {len(section_columns['category'])} rows")
             
-            # Combine results
-            if not sections_data:
+            # Build the combined result in a single allocation
+            if not columns['category']:
                 self.logger.warning("No sections data collected")
                 return pd.DataFrame()
                 
-            result = pd.concat(sections_data, ignore_index=True)
+            result = pd.DataFrame(columns).infer_objects()
+            result['source_file'] = file_path.name
             self.logger.info(f"Combined data has {len(result)} rows")
             
             return result
@@ -69,12 +114,34 @@ class KindergartenExcelExtractor(BaseExcelExtractor):
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             raise
 
+    @staticmethod
+    def _cell_positions(df: pd.DataFrame, keys: Optional[FrozenSet[str]] = None) -> pd.DataFrame:
+        """
+        Clean every cell once and list the (row, column, value) of the cells to match.
+        
+        Cells are listed column by column, matching the original search order.
+        
+        Args:
+            df: DataFrame containing the data
+            keys: Only list cells whose cleaned value is one of these (optional, default: all cells)
+            
+        Returns:
+            pd.DataFrame: Table with row_idx, col_idx and key columns
+        """
+        cells = df.fillna('').astype(str).apply(lambda s: s.str.strip())
+        values = cells.to_numpy(dtype=object)
+        mask = cells.isin(keys).to_numpy() if keys is not None else np.ones(values.shape, dtype=bool)
+        col_idx, row_idx = np.nonzero(mask.T)
+        return pd.DataFrame({'row_idx': row_idx, 'col_idx': col_idx, 'key': values[row_idx, col_idx]})
+
     def _extract_section(
         self,
         df: pd.DataFrame,
         structure: Dict,
         file_path: Path,
-    ) -> pd.DataFrame:
+        lookup: Optional[pd.DataFrame] = None,
+        positions: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, List]:
         """
         Extract data from a section based on structure.
         
@@ -82,69 +149,50 @@ class KindergartenExcelExtractor(BaseExcelExtractor):
             df: DataFrame containing the data
             structure: Dictionary defining the data structure to look for
             file_path: Source file path for reference
+            lookup: Precompiled lookup table for structure (optional)
+            positions: Result of _cell_positions(df) to reuse (optional)
             
         Returns:
-            pd.DataFrame: Extracted data
+            Dict[str, List]: Extracted values, one list per entry in VALUE_COLUMNS
         """
         try:
-            data = []
+            if lookup is None:
+                lookup = self._build_lookup(structure)
+            if positions is None:
+                positions = self._cell_positions(df)
             
-            for main_category, subcategories in structure.items():
-                self.logger.debug(f"Processing main category: {main_category}")
-                
-                if not isinstance(subcategories, (list, tuple)):
-                    self.logger.error(f"Invalid subcategories format for {main_category}: {type(subcategories)}")
-                    continue
-                    
-                for subcategory in subcategories:
-                    self.logger.debug(f"Processing subcategory: {subcategory}")
-                    
-                    # Find the row containing this subcategory
-                    for col_idx, col in enumerate(df.columns):
-                        try:
-                            # Convert column to string series and clean it
-                            col_series = df[col].fillna('').astype(str).str.strip()
-                            subcategory_str = str(subcategory).strip()
-                            
-                            # Find matches
-                            mask = col_series == subcategory_str
-                            if mask.any():
-                                row = df[mask].iloc[0]
-                                
-                                # Try to get values from the next columns
-                                try:
-                                    value_2022 = row.iloc[col_idx + 1]
-                                    value_2023 = row.iloc[col_idx + 2]
-                                    abweichung = row.iloc[col_idx + 3]
-                                    
-                                    entry = {
-                                        'category': str(main_category),
-                                        'subcategory': str(subcategory),
-                                        'value_2022': value_2022,
-                                        'value_2023': value_2023,
-                                        'abweichung': abweichung,
-                                        'source_file': file_path.name
-                                    }
-                                    data.append(entry)
-                                    
-                                    self.logger.debug(f"Found values for {subcategory}: {entry}")
-                                    break
-                                except IndexError:
-                                    self.logger.warning(
-                                        f"Found subcategory {subcategory} but couldn't extract all values"
-                                    )
-                        except Exception as e:
-                            self.logger.warning(f"Error processing column {col}: {str(e)}")
-                            continue
-            
-            result_df = pd.DataFrame(data)
-            if len(result_df) == 0:
+            # Hash-join the lookup table against the cell positions
+            matches = lookup.merge(positions, on='key', how='inner')
+            matches = matches.sort_values(['order', 'col_idx', 'row_idx'])
+            
+            # The three value columns must lie to the right of the match
+            in_bounds = matches['col_idx'] + 3 < df.shape[1]
+            matches_found = set(matches['order'])
+            matches = matches[in_bounds].drop_duplicates('order')
+            for order in sorted(matches_found - set(matches['order'])):
+                self.logger.warning(
+                    f"Found subcategory {lookup.at[order, 'subcategory']} but couldn't extract all values"
+                )
+            
+            # Pull the value cells positionally in one go
+            values = df.to_numpy()
+            rows = matches['row_idx'].to_numpy()
+            cols = matches['col_idx'].to_numpy()
+            data = {
+                'category': matches['category'].tolist(),
+                'subcategory': matches['subcategory'].tolist(),
+                'value_2022': values[rows, cols + 1].tolist(),
+                'value_2023': values[rows, cols + 2].tolist(),
+                'abweichung': values[rows, cols + 3].tolist()
+            }
+            
+            if not data['category']:
                 self.logger.warning(f"No data found for structure: {structure}")
             else:
-                self.logger.debug(f"Extracted {len(result_df)} rows of data")
-            return result_df
+                self.logger.debug(f"Extracted {len(data['category'])} rows of data")
+            return data
             
         except Exception as e:
             self.logger.error(f"Error in _extract_section: {str(e)}")
             self.logger.error(f"Traceback: {traceback.format_exc()}")
-            raise 
\ No newline at end of file
+            raise
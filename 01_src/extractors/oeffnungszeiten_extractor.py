@@ -4,13 +4,19 @@ Concrete implementation of Excel extractor for Öffnungszeiten (opening times) d
 
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional, Tuple
+import logging
 
 from .base_extractor import BaseExcelExtractor
 
 class OeffnungszeitenExtractor(BaseExcelExtractor):
     """Extractor for Öffnungszeiten (opening times) data from Excel files."""
     
+    def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
+        super().__init__(config, logger)
+        self._target_groups = frozenset(self.config['target_groups'])
+    
     def _find_table_structure(self, df: pd.DataFrame, start_row: int) -> Tuple[Optional[int], Dict[str, int]]:
         """
         Find the table structure including header row and column positions.
@@ -31,38 +37,36 @@ class OeffnungszeitenExtractor(BaseExcelExtractor):
             'time_range_col': None
         }
         
-        # Look for header row by searching for specific column headers
-        for idx in range(start_row, min(start_row + 15, len(df))):
-            row = df.iloc[idx]
-            
-            for col, val in enumerate(row):
-                if pd.isna(val):
-                    continue
-                val_str = str(val).upper().strip()
-                
-                # Look for key column identifiers
-                if 'WOCHENTAG' in val_str:
-                    columns['days_col'] = col
-                    header_row = idx
-                elif 'STUNDEN' in val_str and not any(x in val_str for x in ['Ø', 'DURCHSCHNITT']):
-                    columns['hours_per_day_col'] = col
-                    header_row = idx
-                elif 'UHRZEIT' in val_str or ('VON' in val_str and 'BIS' in val_str):
-                    columns['time_range_col'] = col
-                    header_row = idx
-                elif 'Ø STUNDEN' in val_str or 'DURCHSCHNITT' in val_str:
-                    columns['hours_col'] = col
+        # Look for header row by searching for specific column headers; each cell is
+        # classified by the first keyword test it passes and the last hit wins
+        window = df.iloc[start_row:start_row + 15].to_numpy(dtype=object)
+        upper = self._text_array(window, lambda val: str(val).upper().strip())
+        
+        def has(keyword: str) -> np.ndarray:
+            return np.char.find(upper, keyword) >= 0
+        
+        days = has('WOCHENTAG')
+        hours_per_day = ~days & has('STUNDEN') & ~(has('Ø') | has('DURCHSCHNITT'))
+        time_range = ~days & ~hours_per_day & (has('UHRZEIT') | (has('VON') & has('BIS')))
+        hours = ~days & ~hours_per_day & ~time_range & (has('Ø STUNDEN') | has('DURCHSCHNITT'))
+        
+        for key, mask in [('days_col', days), ('hours_per_day_col', hours_per_day),
+                          ('time_range_col', time_range), ('hours_col', hours)]:
+            hits = np.argwhere(mask)
+            if len(hits):
+                columns[key] = int(hits[-1][1])
+        
+        header_hits = np.flatnonzero((days | hours_per_day | time_range).any(axis=1))
+        if len(header_hits):
+            header_row = start_row + int(header_hits[-1])
         
         # After finding header row, look for group column
         if header_row is not None:
-            for idx in range(header_row + 1, min(header_row + 5, len(df))):
-                row = df.iloc[idx]
-                for col, val in enumerate(row):
-                    if pd.notna(val) and str(val) in self.config['target_groups']:
-                        columns['group_col'] = col
-                        break
-                if columns['group_col'] is not None:
-                    break
+            window = df.iloc[header_row + 1:header_row + 5].to_numpy(dtype=object)
+            groups = self._text_array(window, str)
+            hits = np.argwhere(pd.notna(window) & np.isin(groups, list(self._target_groups)))
+            if len(hits):
+                columns['group_col'] = int(hits[0][1])
         
         return header_row, columns
     
@@ -80,12 +84,12 @@ class OeffnungszeitenExtractor(BaseExcelExtractor):
             self.logger.info(f"Starting data extraction from {file_path}")
             
             # Find the correct sheet
-            xl = pd.ExcelFile(file_path)
+            xl = self._open_workbook(file_path)
             sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
             self.logger.info(f"Found sheet: {sheet_name}")
             
             # Read the entire sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+            df = self._parse_sheet(xl, file_path, sheet_name, header=None)
             
             # Find the starting row of Öffnungszeiten section
             start_row = self._find_section_start(df, "D. ÖFFNUNGSZEITEN")
@@ -101,31 +105,30 @@ class OeffnungszeitenExtractor(BaseExcelExtractor):
                     self.logger.error(f"Row {idx}: {df.iloc[idx].tolist()}")
                 raise ValueError("Could not identify table structure")
             
-            # Initialize list to store the data
-            data = []
+            # Take the rows below the header as a plain array once; rows qualify when
+            # their group cell names one of the target groups
+            values = df.iloc[header_row + 1:].to_numpy(dtype=object)
+            group_cells = values[:, columns['group_col']]
+            present = pd.notna(group_cells)
+            groups = np.array([str(val) if ok else '' for val, ok in zip(group_cells, present)], dtype=object)
+            mask = present & np.isin(groups, list(self._target_groups))
+            matched = values[mask]
             
-            # Process each row after the header
-            for idx in range(header_row + 1, len(df)):
-                if pd.isna(df.iloc[idx, columns['group_col']]):
-                    continue
-                    
-                group_name = str(df.iloc[idx, columns['group_col']])
-                
-                if group_name in self.config['target_groups']:
-                    row_data = {
-                        'Gruppe': group_name,
-                        'Stunden_pro_Woche': df.iloc[idx, columns['hours_col']] if columns['hours_col'] is not None and pd.notna(df.iloc[idx, columns['hours_col']]) else None,
-                        'Wochentage': df.iloc[idx, columns['days_col']] if columns['days_col'] is not None and pd.notna(df.iloc[idx, columns['days_col']]) else None,
-                        'Stunden_pro_Tag': df.iloc[idx, columns['hours_per_day_col']] if columns['hours_per_day_col'] is not None and pd.notna(df.iloc[idx, columns['hours_per_day_col']]) else None,
-                        'Oeffnungszeiten': df.iloc[idx, columns['time_range_col']] if columns['time_range_col'] is not None and pd.notna(df.iloc[idx, columns['time_range_col']]) else None,
-                        'source_file': Path(file_path).stem
-                    }
-                    self.logger.debug(f"Found group: {group_name}")
-                    self.logger.debug(f"Row data: {row_data}")
-                    data.append(row_data)
+            def column_values(col: Optional[int]) -> List:
+                if col is None:
+                    return [None] * len(matched)
+                cells = matched[:, col]
+                return np.where(pd.notna(cells), cells, None).tolist()
             
-            # Create DataFrame from the collected data
-            result_df = pd.DataFrame(data)
+            result_df = pd.DataFrame({
+                'Gruppe': groups[mask].tolist(),
+                'Stunden_pro_Woche': column_values(columns['hours_col']),
+                'Wochentage': column_values(columns['days_col']),
+                'Stunden_pro_Tag': column_values(columns['hours_per_day_col']),
+                'Oeffnungszeiten': column_values(columns['time_range_col']),
+                'source_file': [Path(file_path).stem] * len(matched)
+            })
+            self.logger.debug("Found groups: %s", result_df['Gruppe'].tolist())
             
             if len(result_df) == 0:
                 raise ValueError("No Öffnungszeiten data found in the file")
@@ -4,44 +4,42 @@ Concrete implementation of Excel extractor for Schliesszeiten (closing times) da
 
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
 from .base_extractor import BaseExcelExtractor
 
+_YEAR_LIKE = np.frompyfunc(lambda text: '/' in text and any(char.isdigit() for char in text), 1, 1)
+
 class SchliesszeitenExtractor(BaseExcelExtractor):
     """Extractor for Schliesszeiten (closing times) data from Excel files."""
     
     REQUIRED_COLUMNS = ["Kindergartenjahr", "Monat", "Schliesstage"]
     SKIP_EMPTY_ROWS = True
     
-    def _find_year_row(self, df: pd.DataFrame, start_row: int) -> Tuple[Optional[int], List[int]]:
-        """Find the row containing kindergarten years and their column positions."""
-        year_cols = []
-        year_row = None
-        
+    def _find_month_row(self, df: pd.DataFrame, start_row: int) -> Optional[int]:
+        """Find the first row within 15 rows of start_row that mentions September."""
+        block = df.iloc[start_row:start_row + 15].to_numpy(dtype=object)
+        upper = self._text_array(block, lambda val: str(val).upper().strip())
+        hits = np.flatnonzero((np.char.find(upper, 'SEPTEMBER') >= 0).any(axis=1))
+        return start_row + int(hits[0]) if len(hits) else None
+    
+    def _find_year_row(self, df: pd.DataFrame, start_row: int) -> Tuple[Optional[int], List[int], Optional[int]]:
+        """Find the row containing kindergarten years, their column positions and the September row."""
         # Look for the first month to determine where data starts
-        month_row = None
-        for idx in range(start_row, min(start_row + 15, len(df))):
-            row = df.iloc[idx]
-            if any('SEPTEMBER' in str(val).upper().strip() for val in row.values if pd.notna(val)):
-                month_row = idx
-                break
-                
+        month_row = self._find_month_row(df, start_row)
         if month_row is None:
-            return None, []
+            return None, [], None
             
         # Look for kindergarten years in rows before the month row
-        for row_idx in range(max(0, month_row - 3), month_row):
-            row = df.iloc[row_idx]
-            for col_idx in range(len(row)):
-                val = str(row[col_idx]).strip() if pd.notna(row[col_idx]) else ''
-                # Look for patterns like "2022/2023" or "2022/23" or "22/23"
-                if '/' in val and any(char.isdigit() for char in val):
-                    year_cols.append(col_idx)
-                    year_row = row_idx
-                    
-        return year_row, year_cols
+        first_row = max(0, month_row - 3)
+        texts = self._text_array(df.iloc[first_row:month_row].to_numpy(dtype=object), lambda val: str(val).strip())
+        # Look for patterns like "2022/2023" or "2022/23" or "22/23"
+        hits = np.argwhere(_YEAR_LIKE(texts).astype(bool))
+        if not len(hits):
+            return None, [], month_row
+        return first_row + int(hits[-1][0]), hits[:, 1].tolist(), month_row
     
     def extract_data(self, file_path: str | Path) -> pd.DataFrame:
         """
@@ -57,57 +55,51 @@ class SchliesszeitenExtractor(BaseExcelExtractor):
             self.logger.info(f"Starting data extraction from {file_path}")
             
             # Find the correct sheet
-            xl = pd.ExcelFile(file_path)
+            xl = self._open_workbook(file_path)
             sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
             self.logger.info(f"Found sheet: {sheet_name}")
             
             # Read the entire sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+            df = self._parse_sheet(xl, file_path, sheet_name, header=None)
             
             # Find the starting row of Schliesszeiten section
             start_row = self._find_section_start(df, "C. SCHLIESSZEITEN")
             if start_row is None:
                 raise ValueError("Could not find 'SCHLIESSZEITEN' section")
                 
-            # Find year row and columns
-            year_row, year_cols = self._find_year_row(df, start_row)
+            # Find year row and columns, along with the row containing "September"
+            # where the months start
+            year_row, year_cols, september_row = self._find_year_row(df, start_row)
             if not year_cols:
                 raise ValueError("Could not find kindergarten years")
                 
-            # Initialize lists to store the data
-            data = []
-            
-            # Find the row containing "September" to start processing months
-            september_row = None
-            for idx in range(start_row, min(start_row + 15, len(df))):
-                row = df.iloc[idx]
-                if any('SEPTEMBER' in str(val).upper().strip() for val in row.values if pd.notna(val)):
-                    september_row = idx
-                    break
+            # Initialize one list per output column
+            kg_years, months, days = [], [], []
                     
             if september_row is None:
                 raise ValueError("Could not find row containing 'September'")
                 
+            # Take the month rows as one block
+            month_names = self.config['months']
+            block = df.iloc[september_row:september_row + len(month_names)].to_numpy(dtype=object)
+            
             # Process each kindergarten year
             for year_col in year_cols:
-                kg_year = str(df.iloc[year_row, year_col]).strip()
+                kg_year = str(df.iat[year_row, year_col]).strip()
                 
                 # Process each month
-                for month_idx, month in enumerate(self.config['months']):
+                for month_idx, month in enumerate(month_names):
                     try:
                         # Read closing days from the year column
-                        closing_days = df.iloc[september_row + month_idx, year_col + 1]
+                        closing_days = block[month_idx, year_col + 1]
                         
                         # Only add entries where we have actual closing days
                         if pd.notna(closing_days) and str(closing_days).strip() != '':
                             try:
                                 closing_days = int(float(str(closing_days).strip()))
-                                data.append({
-                                    'Kindergartenjahr': kg_year,
-                                    'Monat': month,
-                                    'Schliesstage': closing_days,
-                                    'source_file': Path(file_path).stem
-                                })
+                                kg_years.append(kg_year)
+                                months.append(month)
+                                days.append(closing_days)
                             except ValueError:
                                 self.logger.warning(
                                     f"Could not convert '{closing_days}' to integer "
@@ -118,8 +110,13 @@ class SchliesszeitenExtractor(BaseExcelExtractor):
                             f"Error processing {month} for {kg_year}: {str(e)}"
                         )
             
-            # Create DataFrame from the collected data
-            result_df = pd.DataFrame(data)
+            # Create DataFrame from the collected columns
+            result_df = pd.DataFrame({
+                'Kindergartenjahr': kg_years,
+                'Monat': months,
+                'Schliesstage': days,
+                'source_file': [Path(file_path).stem] * len(days)
+            })
             
             if len(result_df) == 0:
                 raise ValueError("No Schliesszeiten data found in the file")
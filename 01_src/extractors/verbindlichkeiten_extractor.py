@@ -29,19 +29,19 @@ class VerbindlichkeitenExtractor(BaseExcelExtractor):
             
             # Find the correct sheet
             self.logger.debug(f"Opening Excel file: {str(file_path)}")
-            xl = pd.ExcelFile(str(file_path))
+            xl = self._open_workbook(file_path)
             sheet_name = self._find_matching_sheet(xl, self.config.get('sheet_patterns', ["NB_Vermögensübersicht"]))
             self.logger.debug(f"Found sheet: {sheet_name}")
             
             # Read the entire sheet
             self.logger.debug(f"Reading sheet {sheet_name} from {str(file_path)}")
-            df = pd.read_excel(str(file_path), sheet_name=sheet_name, header=None)
+            df = self._parse_sheet(xl, file_path, sheet_name, header=None)
             self.logger.debug(f"DataFrame shape: {df.shape}")
             
             # Extract section
             structure = self.config['section_a_structure']
-            self.logger.debug(f"Structure: {structure}")
-            result = self._extract_section(df.copy(), structure, file_path)
+            self.logger.debug("Structure: %s", structure)
+            result = self._extract_section(df, structure, file_path)
             self.logger.info(f"Extracted {len(result)} rows")
             
             return result
@@ -69,15 +69,16 @@ class VerbindlichkeitenExtractor(BaseExcelExtractor):
             pd.DataFrame: Extracted data
         """
         try:
-            data = []
+            # Accumulate one list per output column
+            categories, items_found, values_start, values_end, changes = [], [], [], [], []
             
             # Find the date row to get column indices for values
-            date_row_mask = df.apply(lambda x: x.astype(str).str.contains('2023-01-01', na=False)).any(axis=1)
+            date_row_mask = self._rows_containing(df, '2023-01-01')
             if not date_row_mask.any():
                 self.logger.warning("Could not find date row with '2023-01-01'")
                 return pd.DataFrame()
                 
-            date_row_idx = date_row_mask.idxmax()
+            date_row_idx = int(date_row_mask.argmax())
             date_row = df.iloc[date_row_idx]
             
             # Find column indices for start, end, and change values
@@ -98,46 +99,45 @@ class VerbindlichkeitenExtractor(BaseExcelExtractor):
                 self.logger.warning("Could not find all required value columns")
                 return pd.DataFrame()
             
+            # Clean all cells once and work on the underlying arrays
+            values = df.to_numpy()
+            cells = self._clean_cells(values)
+            first_rows = self._first_row_index(cells)
+            value_cols = [start_col_idx, end_col_idx, change_col_idx]
+            
             for main_category, items in structure.items():
-                self.logger.debug(f"Processing main category: {main_category}")
+                self.logger.debug("Processing main category: %s", main_category)
                 
                 if not isinstance(items, (list, tuple)):
                     self.logger.error(f"Invalid items format for {main_category}: {type(items)}")
                     continue
                     
                 for item in items:
-                    self.logger.debug(f"Processing item: {item}")
+                    self.logger.debug("Processing item: %s", item)
+                    item_str = str(item).strip()
                     
-                    # Find the row containing this item
-                    for col_idx, col in enumerate(df.columns):
-                        try:
-                            # Convert column to string series and clean it
-                            col_series = df[col].fillna('').astype(str).str.strip()
-                            item_str = str(item).strip()
-                            
-                            # Find matches
-                            mask = col_series == item_str
-                            if mask.any():
-                                row = df[mask].iloc[0]
-                                
-                                # Get values using the correct column indices
-                                entry = {
-                                    'category': str(main_category),
-                                    'item': str(item),
-                                    'value_2023_start': row.iloc[start_col_idx],
-                                    'value_2023_end': row.iloc[end_col_idx],
-                                    'change': row.iloc[change_col_idx],
-                                    'source_file': file_path.name
-                                }
-                                data.append(entry)
-                                self.logger.debug(f"Found values for {item}: {entry}")
-                                break
-                                
-                        except Exception as e:
-                            self.logger.warning(f"Error processing column {col}: {str(e)}")
-                            continue
-            
-            result_df = pd.DataFrame(data)
+                    # Look up the first row containing this item, column by column
+                    row_idx = first_rows.get(item_str)
+                    if row_idx is not None:
+                        # Get values using the correct column indices
+                        value_start, value_end, change = values[row_idx, value_cols]
+                        categories.append(str(main_category))
+                        items_found.append(str(item))
+                        values_start.append(value_start)
+                        values_end.append(value_end)
+                        changes.append(change)
+                        self.logger.debug(
+                            "Found values for %s: %s, %s, %s", item, value_start, value_end, change
+                        )
+            
+            result_df = pd.DataFrame({
+                'category': categories,
+                'item': items_found,
+                'value_2023_start': values_start,
+                'value_2023_end': values_end,
+                'change': changes,
+                'source_file': file_path.name
+            }) if categories else pd.DataFrame()
             if len(result_df) == 0:
                 self.logger.warning(f"No data found for structure: {structure}")
             else:
@@ -4,6 +4,7 @@ Concrete implementation of Excel extractor for Verpflegung (catering) data.
 
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 import re
 import logging
@@ -11,9 +12,14 @@ import sys
 
 from .base_extractor import BaseExcelExtractor
 
+# Drop the euro sign and thousands separators, turn the decimal comma into a point
+_CURRENCY_TRANS = str.maketrans({'€': None, '.': None, ',': '.'})
+
 class VerpflegungExtractor(BaseExcelExtractor):
     """Extractor for Verpflegung (catering) data from Excel files."""
     
+    _YEAR_RE = re.compile(r'\b20\d{2}\b')  # 4-digit numbers that could be years
+    
     def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
         """Initialize the extractor with configuration."""
         super().__init__(config, logger)
@@ -44,28 +50,23 @@ class VerpflegungExtractor(BaseExcelExtractor):
         self.logger.info(f"Starting year search from row {start_row}")
         
         # Save first few rows to CSV for debugging
-        debug_df = df.iloc[start_row:start_row+10]
-        debug_path = Path('debug_verpflegung_rows.csv')
-        debug_df.to_csv(debug_path, encoding='utf-8')
-        self.logger.info(f"Saved first 10 rows to {debug_path.absolute()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            debug_df = df.iloc[start_row:start_row+10]
+            debug_path = Path('debug_verpflegung_rows.csv')
+            debug_df.to_csv(debug_path, encoding='utf-8')
+            self.logger.debug(f"Saved first 10 rows to {debug_path.absolute()}")
         
         # Look for years in the rows after the header
         for idx in range(start_row, min(start_row + 10, len(df))):
             row = df.iloc[idx]
-            row_values = [str(val) for val in row.values if pd.notna(val)]
-            self.logger.info(f"Row {idx} contents: {row_values}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                row_values = [str(val) for val in row.values if pd.notna(val)]
+                self.logger.debug(f"Row {idx} contents: {row_values}")
             
-            # First try to find a row that has exactly two 4-digit numbers
-            years = []
-            for val in row:
-                if pd.notna(val):
-                    val_str = str(val).strip()
-                    self.logger.info(f"Checking value: '{val_str}'")
-                    # Look for 4-digit numbers that could be years
-                    found_years = re.findall(r'\b20\d{2}\b', val_str)
-                    if found_years:
-                        self.logger.info(f"Found potential year(s) in value '{val_str}': {found_years}")
-                        years.extend(found_years)
+            # First try to find a row that has exactly two 4-digit numbers; the cells are
+            # joined with spaces so one regex pass covers the whole row
+            joined = ' '.join(str(val) for val in row.values if pd.notna(val))
+            years = self._YEAR_RE.findall(joined)
             
             # If we found exactly two years in this row, use them
             if len(years) == 2:
@@ -111,7 +112,7 @@ class VerpflegungExtractor(BaseExcelExtractor):
             if pd.notna(val):
                 if isinstance(val, str):
                     # Handle currency values
-                    val = str(val).replace('€', '').replace('.', '').replace(',', '.').strip()
+                    val = val.translate(_CURRENCY_TRANS).strip()
                     try:
                         val = float(val)
                     except (ValueError, TypeError):
@@ -124,7 +125,7 @@ class VerpflegungExtractor(BaseExcelExtractor):
             year_x_val = values[0]
             year_y_val = values[1]
             
-        self.logger.debug(f"Extracted values for {field}: {year_x_val}, {year_y_val}")
+        self.logger.debug("Extracted values for %s: %s, %s", field, year_x_val, year_y_val)
         return year_x_val, year_y_val
 
     def _extract_boolean_value(self, row: pd.Series, category_col: int) -> Tuple[Optional[str], Optional[str]]:
@@ -175,7 +176,7 @@ class VerpflegungExtractor(BaseExcelExtractor):
             self.logger.info(f"Starting data extraction from {file_path}")
             
             # Find the correct sheet
-            xl = pd.ExcelFile(file_path)
+            xl = self._open_workbook(file_path)
             sheet_names = xl.sheet_names
             self.logger.info(f"Available sheets: {sheet_names}")
             
@@ -183,12 +184,13 @@ class VerpflegungExtractor(BaseExcelExtractor):
             self.logger.info(f"Found sheet: {sheet_name}")
             
             # Read the entire sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+            df = self._parse_sheet(xl, file_path, sheet_name, header=None)
             self.logger.info(f"Read sheet with shape: {df.shape}")
             
             # Save entire sheet for debugging
-            df.to_csv('debug_verpflegung_full.csv')
-            self.logger.info("Saved full sheet to debug_verpflegung_full.csv")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                df.to_csv('debug_verpflegung_full.csv')
+                self.logger.debug("Saved full sheet to debug_verpflegung_full.csv")
             
             # Find the starting row of Verpflegung section
             start_row = self._find_section_start(df, self.config['section_marker'])
@@ -208,40 +210,47 @@ class VerpflegungExtractor(BaseExcelExtractor):
             year_x, year_y = years
             self.logger.info(f"Found years: {year_x}, {year_y}")
             
-            # Initialize data storage with all required columns
-            data = []
+            fields = self.config['verpflegung_rows']
+            if not fields:
+                self.logger.warning(f"No verpflegung_rows configured, skipping {file_path}")
+                return pd.DataFrame(columns=self.config['output_columns'])
+            
+            # Lower-case the section once and locate every (row, cell, field) match;
+            # matches are handled in row, cell, field order as in a row-by-row scan.
+            # The texts stay an object array so one long cell does not widen every other cell.
+            block = df.iloc[start_row:].to_numpy(dtype=object)
+            present = pd.notna(block)
+            lower = np.frompyfunc(lambda val: str(val).strip().lower(), 1, 1)(block)
+            hit_rows, hit_cols, hit_fields = [], [], []
+            for field_idx, field in enumerate(fields):
+                needle = field.lower()
+                contains = np.frompyfunc(lambda text: needle in text, 1, 1)(lower).astype(bool)
+                rows, cols = np.nonzero(present & contains)
+                hit_rows.append(rows)
+                hit_cols.append(cols)
+                hit_fields.append(np.full(len(rows), field_idx))
+            hit_rows, hit_cols, hit_fields = (np.concatenate(hits) for hits in (hit_rows, hit_cols, hit_fields))
+            order = np.lexsort((hit_fields, hit_cols, hit_rows))
             
-            # Process each row looking for the defined fields
-            current_row = start_row
-            while current_row < len(df):
-                row = df.iloc[current_row]
-                
-                # Check each cell in the row for matching fields
-                for col_idx, cell in enumerate(row):
-                    if pd.notna(cell):
-                        cell_str = str(cell).strip()
-                        # Check if this cell contains any of our expected rows
-                        for field in self.config['verpflegung_rows']:
-                            if field.lower() in cell_str.lower():
-                                year_x_val, year_y_val = self._extract_value(row, field, col_idx)
-                                
-                                # Create a row with all required columns
-                                row_data = {
-                                    'category': field,
-                                    'source_file': Path(file_path).stem
-                                }
-                                # Add year columns with proper names
-                                row_data[f'year_{year_x}'] = year_x_val
-                                row_data[f'year_{year_y}'] = year_y_val
-                                
-                                data.append(row_data)
-                                self.logger.debug(f"Found field: {field}")
-                                self.logger.debug(f"Values: {year_x_val}, {year_y_val}")
-                
-                current_row += 1
+            # The number of matches is known, so fill preallocated column buffers
+            n_matches = len(order)
+            categories = np.asarray(fields, dtype=object)[hit_fields[order]]
+            year_x_vals = np.empty(n_matches, dtype=object)
+            year_y_vals = np.empty(n_matches, dtype=object)
+            for i, (row_pos, col_idx, field) in enumerate(zip(hit_rows[order], hit_cols[order], categories)):
+                row = df.iloc[start_row + row_pos]
+                year_x_vals[i], year_y_vals[i] = self._extract_value(row, field, int(col_idx))
+                self.logger.debug("Found field: %s", field)
+                self.logger.debug("Values: %s, %s", year_x_vals[i], year_y_vals[i])
             
-            # Create DataFrame from the collected data
-            result_df = pd.DataFrame(data)
+            # Create DataFrame from the column buffers, with the year columns named after the years;
+            # infer_objects gives numeric year columns a numeric dtype
+            result_df = pd.DataFrame({
+                'category': categories,
+                'source_file': [Path(file_path).stem] * n_matches,
+                f'year_{year_x}': year_x_vals,
+                f'year_{year_y}': year_y_vals
+            }).infer_objects() if n_matches else pd.DataFrame()
             
             if len(result_df) == 0:
                 raise ValueError("No Verpflegung data found in the file")
@@ -4,6 +4,7 @@ Extractor for Verteilungsschluessel (distribution key) data from kindergarten Ex
 
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from typing import Dict, Optional, Tuple
 import logging
 from .base_extractor import BaseExcelExtractor
@@ -16,19 +17,29 @@ class VerteilungsschluesselExtractor(BaseExcelExtractor):
         super().__init__(config, logger)
         self.validate_config_sections(['sheet_patterns', 'section_marker', 'columns', 'headers', 'years'])
         
+    @staticmethod
+    def _to_fraction(value):
+        """Convert percentage strings like '45%' to fractions; other values pass through."""
+        if isinstance(value, str):
+            return float(value.rstrip('%')) / 100
+        return value
+    
     def _find_data_columns(self, df: pd.DataFrame, start_row: int) -> Tuple[Optional[int], Optional[int]]:
         """Find the columns containing Kindergarten and Hort data."""
         kg_col = None
         hort_col = None
         
+        kg_header = self.config['headers']['kindergarten']
+        hort_header = self.config['headers']['hort']
+        
         # Look in the row before the first year row for the column headers
-        for col in df.columns:
-            if pd.notna(df.iloc[start_row-1, col]):
-                header = str(df.iloc[start_row-1, col]).strip()
-                if self.config['headers']['kindergarten'] in header:
-                    kg_col = col
-                elif self.config['headers']['hort'] in header:
-                    hort_col = col
+        header_row = df.iloc[start_row-1].to_numpy(dtype=object)
+        for pos in np.flatnonzero(pd.notna(header_row)):
+            header = str(header_row[pos]).strip()
+            if kg_header in header:
+                kg_col = df.columns[pos]
+            elif hort_header in header:
+                hort_col = df.columns[pos]
                     
         return kg_col, hort_col
     
@@ -48,11 +59,11 @@ class VerteilungsschluesselExtractor(BaseExcelExtractor):
         file_path = Path(file_path)
         
         # Find the correct sheet
-        xl = pd.ExcelFile(str(file_path))
+        xl = self._open_workbook(file_path)
         sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
         
         # Read the full sheet
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+        df = self._parse_sheet(xl, file_path, sheet_name, header=None)
         
         # Find the starting row of Verteilungsschluessel section
         start_row = self._find_section_start(df, self.config['section_marker'])
@@ -69,31 +80,25 @@ class VerteilungsschluesselExtractor(BaseExcelExtractor):
         kg_col, hort_col = self._find_data_columns(df, start_row)
         
         # Look for the data rows
-        for idx in range(start_row, min(start_row + 10, len(df))):
-            row = df.iloc[idx]
-            
+        years = set(self.config['years'])
+        for row in df.iloc[start_row:start_row + 10].to_numpy(dtype=object):
             # Look for year rows
-            for col in range(len(row)):
-                cell_value = str(row[col]).strip() if pd.notna(row[col]) else ''
+            for val in row:
+                cell_value = str(val).strip() if pd.notna(val) else ''
                 
                 # Check for year identifiers
-                if cell_value in self.config['years']:
+                if cell_value in years:
                     if kg_col is not None:
-                        data[f'kindergarten_{cell_value}'] = df.iloc[idx, kg_col]
+                        data[f'kindergarten_{cell_value}'] = self._to_fraction(row[kg_col])
                     if hort_col is not None:
-                        data[f'hort_{cell_value}'] = df.iloc[idx, hort_col]
+                        data[f'hort_{cell_value}'] = self._to_fraction(row[hort_col])
         
         # Convert to DataFrame
         result_df = pd.DataFrame([data])
         
-        # Convert percentage values to floats
-        for col in result_df.columns:
-            if col != 'source_file':
-                result_df[col] = pd.to_numeric(
-                    result_df[col].str.rstrip('%').astype(float) / 100 
-                    if isinstance(result_df[col].iloc[0], str) 
-                    else result_df[col]
-                )
+        # Percentages were converted on insertion; give empty keys a numeric dtype too
+        value_cols = result_df.columns.drop('source_file')
+        result_df[value_cols] = result_df[value_cols].apply(pd.to_numeric)
         
         self.logger.info(f"Extracted data: {result_df.to_dict('records')[0]}")
         return result_df 
\ No newline at end of file
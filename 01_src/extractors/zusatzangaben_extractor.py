@@ -4,31 +4,51 @@ Concrete implementation of Excel extractor for Zusatzangaben (additional informa
 
 from pathlib import Path
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional
 import re
+import logging
+import unicodedata
 
 from .base_extractor import BaseExcelExtractor
 
+_STRIP = np.frompyfunc(lambda val: str(val).strip(), 1, 1)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_UMLAUT_TABLE = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+_STOPWORDS = frozenset(['ist', 'das', 'die', 'der', 'und', 'oder', 'im', 'in', 'bei', 'zu', 'zur', 'zum'])
+
 class ZusatzangabenExtractor(BaseExcelExtractor):
     # Hardcoded validation rules
     REQUIRED_COLUMNS = ["Name_Eintrag", "Eintrag"]
     SKIP_EMPTY_ROWS = True
     TRIM_WHITESPACE = True
     
+    def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
+        super().__init__(config, logger)
+        # Normalize the predefined questions once; the first question wins on duplicates
+        self._question_index: Dict[str, Dict] = {}
+        for question in self.config['zusatzangaben']:
+            self._question_index.setdefault(self._normalize_question(question), {
+                'question': question,
+                'normalized': self._generate_normalized_key(question)
+            })
+    
     def _normalize_question(self, question: str) -> str:
         """Normalize a question by removing whitespace, newlines, and special characters."""
         if not question or not isinstance(question, str):
             return ""
+        # Compose decomposed umlauts (e.g. 'u' + combining diaeresis) so both spellings match
+        question = unicodedata.normalize('NFC', question)
         return self._normalize_text(question) if self.TRIM_WHITESPACE else question
     
     def _generate_normalized_key(self, question: str) -> str:
         """Generate a normalized key from a question text."""
         # Remove special characters and convert to lowercase
-        text = re.sub(r'[^\w\s]', '', question.lower())
+        text = _PUNCT_RE.sub('', unicodedata.normalize('NFC', question).lower())
         # Replace umlauts
-        text = text.replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
+        text = text.translate(_UMLAUT_TABLE)
         # Split into words and take first few significant words
-        words = [w for w in text.split() if w not in ['ist', 'das', 'die', 'der', 'und', 'oder', 'im', 'in', 'bei', 'zu', 'zur', 'zum']]
+        words = [w for w in text.split() if w not in _STOPWORDS]
         key_words = words[:3] if len(words) > 3 else words
         # Join with underscores
         return '_'.join(key_words)
@@ -38,14 +58,7 @@ class ZusatzangabenExtractor(BaseExcelExtractor):
         normalized_input = self._normalize_question(input_question)
         if not normalized_input:
             return None
-            
-        for question in self.config['zusatzangaben']:
-            if self._normalize_question(question) == normalized_input:
-                return {
-                    'question': question,
-                    'normalized': self._generate_normalized_key(question)
-                }
-        return None
+        return self._question_index.get(normalized_input)
 
     def extract_data(self, file_path: str | Path) -> pd.DataFrame:
         """
@@ -61,53 +74,45 @@ class ZusatzangabenExtractor(BaseExcelExtractor):
             self.logger.info(f"Starting data extraction from {file_path}")
             
             # Find the correct sheet
-            xl = pd.ExcelFile(file_path)
+            xl = self._open_workbook(file_path)
             sheet_name = self._find_matching_sheet(xl, self.config['sheet_patterns'])
             self.logger.info(f"Found sheet: {sheet_name}")
             
             # Read the entire sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+            df = self._parse_sheet(xl, file_path, sheet_name, header=None)
             
-            # Initialize lists to store the data
-            data = []
-            unmatched_questions = []
+            # Clean the configured columns in one pass; missing cells become None
+            columns = self.config['columns']
+            block = df.iloc[:, [columns['name_eintrag'], columns['eintrag'], columns['erlaeuterung']]].to_numpy(dtype=object)
+            # Rows without a question (blank rows, trailing empty range) can never match
+            block = block[pd.notna(block[:, 0])]
+            texts = np.where(pd.isna(block), None, _STRIP(block))
+            names = pd.Series(texts[:, 0], dtype=object)
             
-            # Track which questions we've found
-            found_questions = set()
+            # Only process rows that carry a question
+            questions = names[~names.isin(['', 'nan', '-'])]
+            matches = questions.map(self._find_matching_question)
+            found = matches.notna()
+            unmatched_questions = questions[~found].tolist()
             
-            # Process all rows
-            for idx, row in df.iterrows():
-                # Get values from configured columns
-                name_eintrag = str(row.iloc[self.config['columns']['name_eintrag']]).strip() if pd.notna(row.iloc[self.config['columns']['name_eintrag']]) else None
-                eintrag = str(row.iloc[self.config['columns']['eintrag']]).strip() if pd.notna(row.iloc[self.config['columns']['eintrag']]) else None
-                erlaeuterung = str(row.iloc[self.config['columns']['erlaeuterung']]).strip() if pd.notna(row.iloc[self.config['columns']['erlaeuterung']]) else None
-                
-                # Apply validation rules
-                if self.SKIP_EMPTY_ROWS and not name_eintrag:
-                    continue
-                
-                # Only process if we have a question
-                if name_eintrag and name_eintrag != 'nan' and name_eintrag != '-':
-                    # Find matching predefined question
-                    matching_question = self._find_matching_question(name_eintrag)
-                    
-                    if matching_question:
-                        found_questions.add(matching_question['question'])
-                        row_data = {
-                            'Name_Eintrag': name_eintrag,
-                            'Eintrag': eintrag,
-                            'Erlaeuterung': erlaeuterung if erlaeuterung and erlaeuterung != 'nan' else None,
-                            'source_file': Path(file_path).stem,
-                            'normalized_key': matching_question['normalized']
-                        }
-                        
-                        # Validate required columns
-                        if all(row_data.get(col) for col in self.REQUIRED_COLUMNS):
-                            data.append(row_data)
-                        else:
-                            self.logger.warning(f"Row missing required columns: {row_data}")
-                    else:
-                        unmatched_questions.append(name_eintrag)
+            matched_rows = matches.index[found].to_numpy()
+            matches = matches[found].tolist()
+            found_questions = {match['question'] for match in matches}
+            
+            rows = pd.DataFrame({
+                'Name_Eintrag': texts[matched_rows, 0],
+                'Eintrag': texts[matched_rows, 1],
+                'Erlaeuterung': [erlaeuterung if erlaeuterung and erlaeuterung != 'nan' else None
+                                 for erlaeuterung in texts[matched_rows, 2]],
+                'source_file': Path(file_path).stem,
+                'normalized_key': [match['normalized'] for match in matches]
+            }, dtype=object)
+            
+            # Validate required columns
+            complete = rows[self.REQUIRED_COLUMNS].map(bool).all(axis=1)
+            for row_data in rows[~complete].to_dict('records'):
+                self.logger.warning(f"Row missing required columns: {row_data}")
+            data = {column: values[complete].tolist() for column, values in rows.items()}
             
             # Check for missing questions
             all_questions = set(self.config['zusatzangaben'])
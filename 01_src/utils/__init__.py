@@ -1,10 +1,11 @@
 # Empty file to make the directory a Python package 
 
-from .excel_utils import find_sheet_with_content, process_multiple_files, extract_section_data, load_structure, find_sheet_by_cell_value
+from .excel_utils import EXCEL_ENGINE, find_sheet_with_content, process_multiple_files, extract_section_data, load_structure, find_sheet_by_cell_value
 from .checkpoint_utils import get_processed_files, update_checkpoint, handle_problematic_files
 from .logging_utils import setup_logger
 
 __all__ = [
+    'EXCEL_ENGINE',
     'find_sheet_with_content',
     'process_multiple_files',
     'get_processed_files',
@@ -3,23 +3,57 @@ import os
 from pathlib import Path
 import pandas as pd
 
+def _is_legacy_checkpoint(f):
+    """
+    Return True if the open checkpoint file holds a legacy JSON list.
+    
+    Only reads up to the first non-whitespace character, so the check stays cheap
+    on every checkpoint update. The file position is reset to the start.
+    """
+    is_legacy = False
+    while chunk := f.read(64):
+        stripped = chunk.lstrip()
+        if stripped:
+            is_legacy = stripped.startswith('[')
+            break
+    f.seek(0)
+    return is_legacy
+
 def get_processed_files(checkpoint_file):
-    """Load the set of processed files from the checkpoint file."""
+    """
+    Load the set of processed files from the checkpoint file.
+    
+    The checkpoint holds one file name per line. Older checkpoints stored a
+    JSON list; those are still read.
+    """
     if os.path.exists(checkpoint_file):
-        with open(checkpoint_file, 'r') as f:
-            return set(json.load(f))
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            if _is_legacy_checkpoint(f):
+                return set(json.load(f))
+            return set(filter(None, f.read().splitlines()))
     return set()
 
+def _migrate_checkpoint(checkpoint_file):
+    """Rewrite a legacy JSON list checkpoint as one file name per line."""
+    if not os.path.exists(checkpoint_file):
+        return
+    with open(checkpoint_file, 'r', encoding='utf-8') as f:
+        is_legacy = _is_legacy_checkpoint(f)
+    if is_legacy:
+        processed_files = get_processed_files(checkpoint_file)
+        with open(checkpoint_file, 'w', encoding='utf-8') as f:
+            f.writelines(f"{name}\n" for name in processed_files)
+
 def update_checkpoint(checkpoint_file, file_name):
-    """Update the checkpoint file with a newly processed file."""
-    processed_files = get_processed_files(checkpoint_file)
-    processed_files.add(file_name)
-    
+    """Update the checkpoint file with a newly processed file by appending one line."""
     # Ensure directory exists
-    os.makedirs(os.path.dirname(checkpoint_file), exist_ok=True)
+    checkpoint_dir = os.path.dirname(checkpoint_file)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
     
-    with open(checkpoint_file, 'w') as f:
-        json.dump(list(processed_files), f)
+    _migrate_checkpoint(checkpoint_file)
+    with open(checkpoint_file, 'a', encoding='utf-8') as f:
+        f.write(f"{file_name}\n")
 
 def handle_problematic_files(problematic_files, directory_path, script_name):
     """Save information about problematic files to a CSV."""
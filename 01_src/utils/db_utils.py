@@ -3,6 +3,8 @@ Database utility functions for SQL Server operations.
 """
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
 import logging
 from sqlalchemy import create_engine, MetaData, Table, Column, types, text
@@ -12,6 +14,26 @@ from typing import Dict, Optional
 import numpy as np
 import pyodbc
 
+# Optional bulk-copy backend for large inserts (needs the bcp command line utility)
+try:
+    from bcpandas import SqlCreds, to_sql as bcp_to_sql
+except ImportError:
+    bcp_to_sql = None
+
+# SQL types for non-text pandas dtypes, keyed by dtype.kind
+_KIND_TYPES = {
+    'i': types.Integer,
+    'u': types.Integer,
+    'f': types.Float,
+    'M': types.DateTime,
+    'b': types.Boolean,
+}
+# Column names that need the longer String length
+_LONG_TEXT_RE = re.compile('beschreibung|erlaeuterung|kommentar|eintrag')
+
+# (engine URL, schema, table) combinations already created or checked in this process
+_created_tables = set()
+
 def test_direct_odbc_connection(config: dict, logger: logging.Logger) -> bool:
     """Test direct ODBC connection to diagnose issues."""
     try:
@@ -51,18 +73,13 @@ def infer_sql_type(dtype: str, column_name: str) -> types.TypeEngine:
         SQLAlchemy type
     """
     # Handle numpy/pandas dtypes
-    if pd.api.types.is_integer_dtype(dtype):
-        return types.Integer()
-    elif pd.api.types.is_float_dtype(dtype):
-        return types.Float()
-    elif pd.api.types.is_datetime64_any_dtype(dtype):
-        return types.DateTime()
-    elif pd.api.types.is_bool_dtype(dtype):
-        return types.Boolean()
+    sql_type = _KIND_TYPES.get(pd.api.types.pandas_dtype(dtype).kind)
+    if sql_type is not None:
+        return sql_type()
     
     # Default to String with appropriate length
     # Use longer length for specific columns that might need it
-    if any(keyword in column_name.lower() for keyword in ['beschreibung', 'erlaeuterung', 'kommentar', 'eintrag']):
+    if _LONG_TEXT_RE.search(column_name.lower()):
         return types.String(length=1000)
     return types.String(length=255)
 
@@ -76,14 +93,15 @@ def derive_sql_types(df: pd.DataFrame) -> Dict[str, types.TypeEngine]:
     Returns:
         Dictionary mapping column names to SQLAlchemy types
     """
-    sql_types = {}
-    for column in df.columns:
-        dtype = df[column].dtype
-        sql_types[column] = infer_sql_type(dtype, column)
-    return sql_types
+    return {column: infer_sql_type(dtype, column) for column, dtype in df.dtypes.items()}
 
 def load_db_config() -> dict:
-    """Load database configuration from config.json."""
+    """Load database configuration from config.json (read once per process, a fresh copy per call)."""
+    return dict(_read_db_config())
+
+@lru_cache(maxsize=1)
+def _read_db_config() -> dict:
+    """Read config.json once; callers must go through load_db_config, which copies the result."""
     try:
         config_path = Path(__file__).parent.parent / "config.json"
         with open(config_path, 'r') as f:
@@ -130,19 +148,27 @@ def test_connection(engine, logger: logging.Logger) -> bool:
         logger.error(f"SQLAlchemy connection test failed: {str(e)}")
         return False
 
-def get_engine(config: Optional[dict] = None):
-    """Get SQLAlchemy engine for database operations."""
-    if config is None:
-        config = load_db_config()
-    connection_string = create_connection_string(config)
+@lru_cache(maxsize=None)
+def _create_engine(connection_string: str):
+    """Create one pooled engine per connection string and reuse it."""
     return create_engine(
         connection_string,
         pool_pre_ping=True,
         pool_timeout=30,
-        pool_recycle=1800
+        pool_recycle=1800,
+        fast_executemany=True
     )
 
-def write_to_sql(df: pd.DataFrame, table_name: str, sql_types: Optional[Dict] = None, logger: Optional[logging.Logger] = None):
+def get_engine(config: Optional[dict] = None):
+    """Get SQLAlchemy engine for database operations."""
+    if config is None:
+        config = load_db_config()
+    connection_string = create_connection_string(config)
+    return _create_engine(connection_string)
+
+def write_to_sql(df: pd.DataFrame, table_name: str, sql_types: Optional[Dict] = None, logger: Optional[logging.Logger] = None,
+                 chunksize: int = 10_000, use_bulk: bool = False, create_table: bool = True,
+                 diagnose: bool = False):
     """
     Write DataFrame to SQL Server table.
     
@@ -151,6 +177,12 @@ def write_to_sql(df: pd.DataFrame, table_name: str, sql_types: Optional[Dict] =
         table_name: Name of the target table
         sql_types: Optional dictionary mapping column names to SQLAlchemy types. If None, types will be inferred.
         logger: Optional logger instance for logging operations
+        chunksize: Rows per executemany batch. With fast_executemany each batch is sent as one parameter array.
+        use_bulk: Load the rows with bcp via bcpandas instead of INSERT statements. Falls back to
+            to_sql when bcpandas is not installed.
+        create_table: Create the table if it does not exist. Pass False when the table is known to exist.
+        diagnose: Run the direct ODBC and SQLAlchemy connection tests before writing. Otherwise
+            connection problems surface from the write itself (the engine pre-pings pooled connections).
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -160,7 +192,7 @@ def write_to_sql(df: pd.DataFrame, table_name: str, sql_types: Optional[Dict] =
         config = load_db_config()
         
         # First try direct ODBC connection
-        if not test_direct_odbc_connection(config, logger):
+        if diagnose and not test_direct_odbc_connection(config, logger):
             raise ConnectionError("Could not establish direct ODBC connection")
         
         # Derive SQL types if not provided
@@ -171,26 +203,46 @@ def write_to_sql(df: pd.DataFrame, table_name: str, sql_types: Optional[Dict] =
         engine = get_engine(config)
         
         # Test SQLAlchemy connection
-        if not test_connection(engine, logger):
+        if diagnose and not test_connection(engine, logger):
             raise ConnectionError("Could not establish SQLAlchemy connection")
             
         schema_name = config.get('schema_name', 'dbo')
         
-        # Create table if it doesn't exist
-        metadata = MetaData()
-        columns = [Column(name, sql_type) for name, sql_type in sql_types.items()]
-        table = Table(table_name, metadata, *columns, schema=schema_name)
-        metadata.create_all(engine)
+        # Create table if it doesn't exist (checked once per process)
+        table_key = (str(engine.url), schema_name, table_name)
+        if create_table and table_key not in _created_tables:
+            metadata = MetaData()
+            columns = [Column(name, sql_type) for name, sql_type in sql_types.items()]
+            Table(table_name, metadata, *columns, schema=schema_name)
+            metadata.create_all(engine)
+            _created_tables.add(table_key)
         
-        # Write data to table
-        df.to_sql(
-            name=table_name,
-            con=engine,
-            schema=schema_name,
-            if_exists='append',
-            index=False,
-            dtype=sql_types
-        )
+        if use_bulk and bcp_to_sql is None:
+            logger.warning("bcpandas is not installed, falling back to to_sql")
+        
+        if use_bulk and bcp_to_sql is not None:
+            # Bulk copy the data into the table created above
+            bcp_to_sql(
+                df,
+                table_name,
+                SqlCreds.from_engine(engine),
+                schema=schema_name,
+                index=False,
+                if_exists='append',
+                batch_size=chunksize
+            )
+        else:
+            # Write data to table in batched executemany calls within one transaction
+            with engine.begin() as conn:
+                df.to_sql(
+                    name=table_name,
+                    con=conn,
+                    schema=schema_name,
+                    if_exists='append',
+                    index=False,
+                    dtype=sql_types,
+                    chunksize=chunksize
+                )
         
         logger.info(f"Successfully wrote {len(df)} rows to {schema_name}.{table_name}")
         logger.debug("Column types:")
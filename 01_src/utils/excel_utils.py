@@ -1,40 +1,93 @@
 import pandas as pd
+import numpy as np
 import os
 import logging
 from pathlib import Path
+from fnmatch import fnmatch, fnmatchcase
+from datetime import datetime
+import copy
+from functools import lru_cache
+from typing import Iterable, Sequence
 import yaml
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, utils as fuzz_utils
 
-def find_sheet_with_content(file_path, search_text, nrows=500):
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer the Rust-based calamine reader when available, otherwise let pandas pick its default
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Sheets that never hold extractable data (compared upper-case)
+NON_DATA_SHEETS = frozenset({"INFORMATION"})
+
+_CELL_TEXT = np.frompyfunc(lambda val: str(val).strip(), 1, 1)
+
+def _cell_texts(values):
+    """Return the stripped text of every cell in an object array, with '' for missing cells."""
+    return np.where(pd.isna(values), '', _CELL_TEXT(values))
+
+def _contains(texts, pattern):
+    """Return a boolean mask of the cell texts that contain pattern."""
+    return np.frompyfunc(lambda text: pattern in text, 1, 1)(texts).astype(bool)
+
+def _to_float(values):
+    """Parse an object array of cell values as floats, accepting decimal commas; unparsable cells become NaN."""
+    texts = pd.Series(values, dtype=object).astype(str).str.replace(',', '.', regex=False)
+    return pd.to_numeric(texts, errors='coerce').to_numpy(dtype=float)
+
+def _first_row_matching(texts, predicate, start=0):
+    """Return the index of the first row at or after start with a cell text matching predicate, or None."""
+    window = texts[start:]
+    if window.size == 0:
+        return None
+    hits = np.flatnonzero(np.frompyfunc(predicate, 1, 1)(window).astype(bool).any(axis=1))
+    return start + int(hits[0]) if hits.size else None
+
+def find_sheet_with_content(file_path, search_text, nrows=500, max_cols=10, skip_sheet_patterns=NON_DATA_SHEETS):
     """
     Find the first sheet in an Excel file that contains the specified text.
     
     Args:
         file_path (str): Path to the Excel file
         search_text (str): Text to search for in the sheet
-        nrows (int): Number of rows to preview in each sheet (default: 50)
+        nrows (int): Number of rows to preview in each sheet (default: 500)
+        max_cols (int): Number of leftmost columns to search (default: 10). Section
+            titles sit in the first columns of the templates; widen this for sheets
+            where the search text can appear further right.
+        skip_sheet_patterns (iterable of str): Sheet names to skip without reading them,
+            case-insensitive, wildcards allowed (default: NON_DATA_SHEETS)
     
     Returns:
         str: Name of the sheet containing the text, or None if not found
     """
-    xl = pd.ExcelFile(file_path)
-    
-    for sheet_name in xl.sheet_names:
-        # Skip the INFORMATION sheet
-        if sheet_name.upper() == "INFORMATION":
-            continue
-            
-        # Read first few rows to check for the search text
-        preview_df = pd.read_excel(
-            file_path,
-            sheet_name=sheet_name,
-            nrows=nrows
-        )
-        # Convert values to string and check if search text exists
-        if any(search_text in str(val).upper() 
-               for val in preview_df.values.flatten() 
-               if pd.notna(val)):
-            return sheet_name
+    # str.upper per cell; np.char.upper truncates when a character expands (e.g. 'ß' -> 'SS')
+    contains = np.frompyfunc(lambda text: search_text in text.upper(), 1, 1)
+    skip_patterns = [pattern.upper() for pattern in skip_sheet_patterns]
+    
+    # Open the workbook once and parse the previews from the same handle
+    with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as xl:
+        for sheet_name in xl.sheet_names:
+            # Skip sheets that cannot hold the content (INFORMATION by default) without reading them
+            if any(fnmatchcase(str(sheet_name).upper(), pattern) for pattern in skip_patterns):
+                continue
+                
+            # Read the top-left block of the sheet to check for the search text.
+            # header=None keeps positional column labels for usecols; the first row
+            # is the header row and stays excluded from the search.
+            preview_df = xl.parse(
+                sheet_name, header=None, nrows=nrows + 1, usecols=lambda col: col < max_cols,
+                dtype=str, na_filter=False
+            )
+            # Check all preview cells for the search text in one ufunc pass
+            if contains(preview_df.to_numpy(dtype=object)[1:]).any():
+                return sheet_name
     
     return None
 
@@ -45,7 +98,9 @@ def process_multiple_files(
     checkpoint_file="processed_files.json", 
     debug_limit=None,
     process_type="generic",
-    default_columns=None
+    default_columns=None,
+    max_workers=None,
+    sink=None
 ):
     """
     Process multiple Excel files in the specified directory, with checkpoint support.
@@ -58,12 +113,29 @@ def process_multiple_files(
         debug_limit: Limit number of files to process (default: None)
         process_type: Type of processing for logging (default: "generic")
         default_columns: Default columns for empty DataFrame (default: None)
+        max_workers: Number of worker processes; 0 uses one per CPU core. None or 1
+            processes files sequentially (default: None). extraction_function must be
+            picklable when more than one worker is used.
+        sink: Optional callable that receives each file's DataFrame as soon as it is
+            extracted, e.g. to write it to SQL. The frames are then not kept and the
+            function returns None (default: None).
     """
     import glob
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from contextlib import nullcontext
+    from functools import partial
     from .checkpoint_utils import get_processed_files, update_checkpoint, handle_problematic_files
     
-    # Get list of all Excel files in the directory
-    file_paths = glob.glob(os.path.join(directory_path, file_pattern))
+    # Get list of all Excel files in the directory; plain name patterns only need one directory listing
+    if os.sep in file_pattern or (os.altsep and os.altsep in file_pattern) or not os.path.isdir(directory_path):
+        file_paths = glob.glob(os.path.join(directory_path, file_pattern))
+    else:
+        with os.scandir(directory_path) as entries:
+            file_paths = [
+                entry.path for entry in entries
+                if not entry.name.startswith('.') and fnmatch(entry.name, file_pattern) and entry.is_file()
+            ]
     
     if not file_paths:
         raise FileNotFoundError(f"No Excel files found in {directory_path}")
@@ -78,15 +150,35 @@ def process_multiple_files(
     
     # Initialize lists for results and problematic files
     all_results = []
+    processed_count = 0
     problematic_files = []
     
-    # Process each file
-    for file_path in file_paths:
-        file_name = Path(file_path).name
-        if debug_limit is not None or file_name not in processed_files:
+    # Process each file, in worker processes when requested; checkpoints are written here only
+    pending = [
+        (file_path, file_name) for file_path, file_name in zip(file_paths, map(os.path.basename, file_paths))
+        if debug_limit is not None or file_name not in processed_files
+    ]
+    if max_workers == 0:
+        max_workers = os.cpu_count()
+    if max_workers is not None:
+        # No point starting more workers than there are files left
+        max_workers = min(max_workers, len(pending))
+    use_pool = max_workers is not None and max_workers > 1
+    with ProcessPoolExecutor(max_workers=max_workers) if use_pool else nullcontext() as executor:
+        # Taken off the queue as they are consumed so finished results can be freed
+        extractions = deque(
+            executor.submit(extraction_function, file_path).result if executor else partial(extraction_function, file_path)
+            for file_path, _ in pending
+        )
+        for file_path, file_name in pending:
+            extract = extractions.popleft()
             try:
-                df_result = extraction_function(file_path)
-                all_results.append(df_result)
+                df_result = extract()
+                if sink is not None:
+                    sink(df_result)
+                else:
+                    all_results.append(df_result)
+                processed_count += 1
                 
                 logging.info(f"Successfully processed file: {file_name}")
                 if debug_limit is None:
@@ -99,7 +191,7 @@ def process_multiple_files(
                     'file_name': file_name,
                     'error_type': error_type,
                     'error_description': error_message,
-                    'timestamp': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 continue
     
@@ -107,8 +199,10 @@ def process_multiple_files(
     handle_problematic_files(problematic_files, directory_path, process_type)
     
     # Combine results
-    if not all_results:
+    if not processed_count:
         raise ValueError("No files were successfully processed")
+    if sink is not None:
+        return None
     
     combined_df = pd.concat(all_results, ignore_index=True)
     
@@ -147,33 +241,31 @@ def extract_section_data(
     Returns:
         pd.DataFrame: Extracted data
     """
+    # Stripped text of every cell, computed once for all scans below
+    values = df.to_numpy(dtype=object)
+    texts = _cell_texts(values)
+    
     # If year columns are not provided, find them in the header row
     if any(col is None for col in [year_2022_col, year_2023_col, comment_col]):
         # First try to find the actual header row by looking for year columns
         if header_row_index == 8:  # Only if using default
-            for idx in range(len(df)):
-                row = df.iloc[idx]
-                year_found = False
-                for col in range(len(row)):
-                    cell_value = str(row[col]).strip() if pd.notna(row[col]) else ''
-                    if 'abrechnung 2022' in cell_value.lower() or 'abrechnung 2023' in cell_value.lower():
-                        header_row_index = idx
-                        year_found = True
-                        break
-                if year_found:
-                    break
-            logger.debug(f"Found header row at index: {header_row_index}")
+            year_row = _first_row_matching(
+                texts, lambda text: 'abrechnung 2022' in (lowered := text.lower()) or 'abrechnung 2023' in lowered
+            )
+            if year_row is not None:
+                header_row_index = year_row
+            logger.debug("Found header row at index: %s", header_row_index)
         
-        header_row = df.iloc[header_row_index]
+        # Cells claim the first still-missing column they match, in 2022/2023/comment order
+        header_texts = texts[header_row_index]
         
         if year_2022_col is None or year_2023_col is None or comment_col is None:
-            for col in range(len(header_row)):
-                cell_value = str(header_row[col]).strip() if pd.notna(header_row[col]) else ''
-                if year_2022_col is None and ('2022' in cell_value or 'abrechnung 2022' in cell_value.lower()):
+            for col, (cell_value, lowered) in enumerate(zip(header_texts, map(str.lower, header_texts))):
+                if year_2022_col is None and ('2022' in cell_value or 'abrechnung 2022' in lowered):
                     year_2022_col = col
-                elif year_2023_col is None and ('2023' in cell_value or 'abrechnung 2023' in cell_value.lower()):
+                elif year_2023_col is None and ('2023' in cell_value or 'abrechnung 2023' in lowered):
                     year_2023_col = col
-                elif comment_col is None and ('kommentar' in cell_value.lower() or 'zusatzinformation' in cell_value.lower()):
+                elif comment_col is None and ('kommentar' in lowered or 'zusatzinformation' in lowered):
                     comment_col = col
 
         if any([year_2022_col is None, year_2023_col is None, comment_col is None]):
@@ -182,126 +274,119 @@ def extract_section_data(
             year_2023_col = 4 if year_2023_col is None else year_2023_col
             comment_col = 6 if comment_col is None else comment_col
 
-    logger.debug(f"Using columns - 2022: {year_2022_col}, 2023: {year_2023_col}, comment: {comment_col}")
+    logger.debug("Using columns - 2022: %s, 2023: %s, comment: %s", year_2022_col, year_2023_col, comment_col)
 
     # Find the start of the section
-    start_row = None
     section_id = structure.get('section_id', '')  # Get section ID from structure
-    logger.debug(f"Looking for section with ID: {section_id}")
-    
-    # Look for the section header through the entire DataFrame
-    for idx in range(len(df)):
-        row = df.iloc[idx]
-        for col in range(len(row)):
-            cell_value = str(row[col]).strip() if pd.notna(row[col]) else ''
-            # Check for various forms of the section identifier
-            if (section_id in cell_value or 
-                f'{section_identifier}.' in cell_value or 
-                section_identifier.strip() in cell_value):
-                start_row = idx
-                logger.debug(f"Found section start at row {idx}")
-                break
-        if start_row is not None:
-            break
-    
+    logger.debug("Looking for section with ID: %s", section_id)
+    
+    # Look for the section header through the entire DataFrame, checking various forms of the identifier
+    start_row = _first_row_matching(
+        texts,
+        lambda text: (section_id in text or 
+                      f'{section_identifier}.' in text or 
+                      section_identifier.strip() in text)
+    )
     if start_row is None:
         logger.error(f"Section {section_identifier} not found in file")
-        logger.debug("Available sections in structure:")
-        logger.debug(structure.keys())
-        logger.debug("First 20 rows of data:")
-        logger.debug(df.head(20).to_string())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available sections in structure:")
+            logger.debug(structure.keys())
+            logger.debug("First 20 rows of data:")
+            logger.debug(df.head(20).to_string())
         raise ValueError(f"Could not find section {section_identifier}")
-    
-    # Initialize data dictionary
-    data = {
-        'source_file': Path(file_path).name,
-        'category': {},
-        'subcategory': {},
-        'subcategory_desc': {},
-        'detail': {},
-        'year_2022': {},
-        'year_2023': {},
-        'comments': {}
-    }
-    
-    # Process each category from the structure
-    current_category = None
-    current_subcategory = None
-    current_subcategory_desc = None
-    
-    for idx in range(start_row, len(df)):
-        row = df.iloc[idx]
-        
-        # Skip empty rows - fixed to properly handle pandas Series
-        if row.isna().all() or row.astype(str).str.strip().eq('').all():
+    logger.debug("Found section start at row %d", start_row)
+    
+    # One record per item: category, subcategory, subcategory_desc, detail, value_2022, value_2023, comment.
+    # A later match of the same item overwrites it; items without any value cell are not returned.
+    records = {}
+    items_with_values = set()
+    
+    # Process each category from the structure; look up the per-category settings once
+    categories = structure['categories']
+    category_names = list(categories)
+    category_items = [categories[category].get('items', []) for category in category_names]
+    category_descs = [categories[category].get('description', '') for category in category_names]
+    
+    # Pull the columns used below out once
+    descs = texts[:, 2]
+    values_2022 = values[:, year_2022_col]
+    values_2023 = values[:, year_2023_col]
+    has_2022 = pd.notna(values_2022)
+    has_2023 = pd.notna(values_2023)
+    comments = texts[:, comment_col]
+    
+    # The section ends with the row that starts the next main section (that row is still processed)
+    end_row = _first_row_matching(
+        texts[:, :1], lambda text: text.startswith('II.') or 'SACHAUSGABEN' in text, start=start_row + 1
+    )
+    stop_row = len(df) if end_row is None else end_row + 1
+    
+    # Empty descriptions cannot contain a category or an item
+    rows = start_row + np.flatnonzero(descs[start_row:stop_row] != '')
+    row_descs = descs[rows]
+    
+    # Category header rows: index of the first category contained in the description, -1 for none.
+    # Marking in reverse order lets the first category in the structure win.
+    category_hit = np.full(len(rows), -1)
+    for category_idx in range(len(category_names) - 1, -1, -1):
+        category = category_names[category_idx]
+        category_hit[_contains(row_descs, category)] = category_idx
+    for pos in np.flatnonzero(category_hit >= 0):
+        logger.debug("Found category: %s", category_names[category_hit[pos]])
+    
+    # Every row belongs to the most recent category header at or above it
+    last_header = np.maximum.accumulate(np.where(category_hit >= 0, np.arange(len(rows)), -1))
+    row_category = np.where(last_header >= 0, category_hit[last_header], -1)
+    
+    # Item rows: index of the first item of the row's category contained in the description
+    item_hit = np.full(len(rows), -1)
+    for category_idx, items in enumerate(category_items):
+        in_category = np.flatnonzero(row_category == category_idx)
+        if not in_category.size:
             continue
-            
-        # Get cell values
-        desc = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ''
-        val_2022 = row.iloc[year_2022_col] if pd.notna(row.iloc[year_2022_col]) else None
-        val_2023 = row.iloc[year_2023_col] if pd.notna(row.iloc[year_2023_col]) else None
-        comment = str(row.iloc[comment_col]).strip() if pd.notna(row.iloc[comment_col]) else ''
+        for item_idx in range(len(items) - 1, -1, -1):
+            item_hit[in_category[_contains(row_descs[in_category], items[item_idx])]] = item_idx
+    
+    # Parse the value cells of all matched rows at once; decimal commas are accepted, anything else is NaN
+    item_positions = np.flatnonzero(item_hit >= 0)
+    item_rows = rows[item_positions]
+    numbers_2022 = _to_float(values_2022[item_rows])
+    numbers_2023 = _to_float(values_2023[item_rows])
+    
+    for k, pos in enumerate(item_positions):
+        idx = item_rows[k]
+        item = category_items[row_category[pos]][item_hit[pos]]
         
-        # Check if this is a category header
-        for category in structure['categories'].keys():
-            if category in desc:
-                current_category = category
-                current_subcategory = category
-                current_subcategory_desc = structure['categories'][category].get('description', '')
-                logger.debug(f"Found category: {category}")
-                break
-                
-        # If we have a current category, check if this is an item
-        if current_category:
-            items = structure['categories'][current_category].get('items', [])
-            for item in items:
-                if item in desc:
-                    # Found a matching item, store its data
-                    data['category'][item] = section_identifier
-                    data['subcategory'][item] = current_subcategory
-                    data['subcategory_desc'][item] = current_subcategory_desc
-                    data['detail'][item] = desc
-                    if val_2022 is not None:
-                        try:
-                            data['year_2022'][item] = float(str(val_2022).replace(',', '.'))
-                        except (ValueError, TypeError):
-                            data['year_2022'][item] = None
-                    if val_2023 is not None:
-                        try:
-                            data['year_2023'][item] = float(str(val_2023).replace(',', '.'))
-                        except (ValueError, TypeError):
-                            data['year_2023'][item] = None
-                    data['comments'][item] = comment
-                    logger.debug(f"Found item: {item} with values 2022: {val_2022}, 2023: {val_2023}")
-                    break
-        
-        # Check for end of section (next main section)
-        if idx > start_row:
-            cell_value = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-            if cell_value.startswith('II.') or 'SACHAUSGABEN' in cell_value:
-                break
+        # Found a matching item, store its data
+        record = records.setdefault(item, [None] * 7)
+        record[0:4] = [
+            section_identifier, category_names[row_category[pos]], category_descs[row_category[pos]], row_descs[pos]
+        ]
+        if has_2022[idx]:
+            record[4] = numbers_2022[k]
+            items_with_values.add(item)
+        if has_2023[idx]:
+            record[5] = numbers_2023[k]
+            items_with_values.add(item)
+        record[6] = comments[idx]
+        logger.debug(
+            "Found item: %s with values 2022: %s, 2023: %s", item,
+            values_2022[idx] if has_2022[idx] else None, values_2023[idx] if has_2023[idx] else None
+        )
     
-    # Convert to DataFrame
-    rows = []
-    for label in set(list(data['year_2022'].keys()) + list(data['year_2023'].keys())):
-        row = {
-            'source_file': data['source_file'],
-            'category': data['category'].get(label, ''),
-            'subcategory': data['subcategory'].get(label, ''),
-            'subcategory_desc': data['subcategory_desc'].get(label, ''),
-            'detail': data['detail'].get(label, ''),
-            'value_2022': data['year_2022'].get(label),
-            'value_2023': data['year_2023'].get(label),
-            'comment': data['comments'].get(label, '')
-        }
-        rows.append(row)
-    
-    if not rows:
+    # Build the columns directly from the records instead of going through row tuples
+    kept = [record for item, record in records.items() if item in items_with_values]
+    
+    if not kept:
         logger.warning(f"No data was extracted from {file_path}")
         raise ValueError(f"No data extracted from {file_path}")
     
-    logger.debug(f"Extracted {len(rows)} rows of data")
-    return pd.DataFrame(rows) 
+    logger.debug("Extracted %d rows of data", len(kept))
+    columns = ['category', 'subcategory', 'subcategory_desc', 'detail', 'value_2022', 'value_2023', 'comment']
+    data = {'source_file': [Path(file_path).name] * len(kept)}
+    data.update(zip(columns, map(list, zip(*kept))))
+    return pd.DataFrame(data) 
 
 def load_structure(config_file: str) -> dict:
     """
@@ -313,9 +398,16 @@ def load_structure(config_file: str) -> dict:
     Returns:
         dict: The structure configuration
     """
+    # Parsed once per file name; callers get their own copy to modify
+    return copy.deepcopy(_read_structure(config_file))
+
+@lru_cache(maxsize=None)
+def _read_structure(config_file: str) -> dict:
+    """Parse a structure YAML file from the config directory."""
     structure_file = Path(__file__).parent.parent / "config" / config_file
     with open(structure_file, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) 
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 def extract_balance_data(
     df: pd.DataFrame,
@@ -337,10 +429,40 @@ def extract_balance_data(
     Returns:
         pd.DataFrame: Extracted data
     """
+    return extract_balance_data_stream(
+        df.iloc[:, :4].itertuples(index=False, name=None), section_identifier, structure, file_path, logger
+    )
+
+def extract_balance_data_stream(
+    rows: Iterable[Sequence],
+    section_identifier: str,
+    structure: dict,
+    file_path: str | Path,
+    logger: logging.Logger,
+) -> pd.DataFrame:
+    """
+    Extract balance sheet data (Vermögen/Verbindlichkeiten) from an iterator of row tuples.
+    
+    Only the first four cells of each row are used and the iterator is not consumed
+    past the SUMME row, so a streamed sheet never has to be read to the end, e.g.
+    load_workbook(file_path, read_only=True, data_only=True)[sheet].iter_rows(max_col=4, values_only=True).
+    
+    Args:
+        rows: Row tuples (description, value_2023_start, value_2023_end, change, ...)
+        section_identifier: Section identifier (e.g., 'Vermögen', 'Verbindlichkeiten')
+        structure: Structure dictionary from YAML config
+        file_path: Path to the source file
+        logger: Logger instance
+        
+    Returns:
+        pd.DataFrame: Extracted data
+    """
+    rows = iter(rows)
+    
     # Find the section start
     start_row = None
-    for idx in range(len(df)):
-        cell_value = str(df.iloc[idx, 0]).strip() if pd.notna(df.iloc[idx, 0]) else ''
+    for idx, row in enumerate(rows):
+        cell_value = str(row[0]).strip() if pd.notna(row[0]) else ''
         if section_identifier in cell_value:
             start_row = idx
             break
@@ -349,12 +471,14 @@ def extract_balance_data(
         raise ValueError(f"Section {section_identifier} not found in file")
         
     # Initialize data collection
-    rows = []
-    items = structure[section_identifier]['items']
+    records = []
+    source_file = Path(file_path).stem
+    # Items match rows by the part of their name before any parenthesised note
+    item_prefixes = [(item, item.split('(')[0].strip()) for item in structure[section_identifier]['items']]
     
     # Process rows until we hit "SUMME" or empty rows
-    for idx in range(start_row + 1, len(df)):
-        description = str(df.iloc[idx, 0]).strip() if pd.notna(df.iloc[idx, 0]) else ''
+    for idx, row in enumerate(rows, start_row + 1):
+        description = str(row[0]).strip() if pd.notna(row[0]) else ''
         
         # Stop if we hit SUMME
         if 'SUMME' in description.upper():
@@ -365,15 +489,15 @@ def extract_balance_data(
             continue
             
         # Check if this row matches any item in our structure
-        for item in items:
-            if description.startswith(item.split('(')[0].strip()):
+        for item, prefix in item_prefixes:
+            if description.startswith(prefix):
                 try:
-                    value_2023_start = df.iloc[idx, 1] if pd.notna(df.iloc[idx, 1]) else None
-                    value_2023_end = df.iloc[idx, 2] if pd.notna(df.iloc[idx, 2]) else None
-                    change = df.iloc[idx, 3] if pd.notna(df.iloc[idx, 3]) else None
+                    value_2023_start = row[1] if pd.notna(row[1]) else None
+                    value_2023_end = row[2] if pd.notna(row[2]) else None
+                    change = row[3] if pd.notna(row[3]) else None
                     
-                    rows.append({
-                        'source_file': Path(file_path).stem,
+                    records.append({
+                        'source_file': source_file,
                         'category': section_identifier,
                         'item': item,
                         'value_2023_start': value_2023_start,
@@ -384,10 +508,10 @@ def extract_balance_data(
                     logger.warning(f"Error processing row {idx} for item {item}: {e}")
                 break
     
-    if not rows:
+    if not records:
         raise ValueError(f"No data extracted from {file_path}")
         
-    return pd.DataFrame(rows) 
+    return pd.DataFrame(records) 
 
 def find_sheet_by_cell_value(file_path, search_text, cell="A1", threshold=80):
     """
@@ -402,28 +526,29 @@ def find_sheet_by_cell_value(file_path, search_text, cell="A1", threshold=80):
     Returns:
         str: Name of the sheet containing similar text in the specified cell, or None if not found
     """
-    xl = pd.ExcelFile(file_path)
-    
     # Convert search text to uppercase for consistent comparison
     search_text = str(search_text).upper()
-    for sheet_name in xl.sheet_names:
+    # Open the workbook once and read the header rows from the same handle
+    with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as xl:
         # Skip the INFORMATION sheet
-        if sheet_name.upper() == "INFORMATION":
-            continue
-            
-        # Read just the specific cell
-        try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            cell_value = df.columns[0]
-            # Convert to string and compare using fuzzy matching
-            if pd.notna(cell_value):
-                cell_text = str(cell_value).upper()
-                # Use token_set_ratio to handle partial matches and different word orders
-                similarity = fuzz.token_set_ratio(search_text, cell_text)
-                if similarity >= threshold:
-                    return sheet_name
-        except Exception:
-            continue
+        sheet_names = [sheet_name for sheet_name in xl.sheet_names if sheet_name.upper() not in NON_DATA_SHEETS]
+        for sheet_name in sheet_names:
+            # Read just the header row - nrows=0 stops the engine before the data rows
+            try:
+                df = xl.parse(sheet_name=sheet_name, nrows=0)
+                cell_value = df.columns[0]
+                # Convert to string and compare using fuzzy matching
+                if pd.notna(cell_value):
+                    cell_text = str(cell_value).upper()
+                    # Use token_set_ratio to handle partial matches and different word orders;
+                    # default_process lowercases and replaces non-alphanumeric characters with spaces
+                    similarity = fuzz.token_set_ratio(
+                        search_text, cell_text, processor=fuzz_utils.default_process, score_cutoff=threshold
+                    )
+                    if similarity >= threshold:
+                        return sheet_name
+            except Exception:
+                continue
     
     return None 
 
@@ -445,15 +570,15 @@ def debug_excel_file(file_path: str | Path, sheet_name: str | None = None, nrows
         # Read the Excel file
         logger.info(f"\nReading file: {file_path}")
         
-        # If sheet_name is not provided, list available sheets
-        xl = pd.ExcelFile(file_path)
-        if not sheet_name:
-            logger.info(f"Available sheets: {xl.sheet_names}")
-            sheet_name = xl.sheet_names[0]
-            logger.info(f"Using first sheet: {sheet_name}")
-            
-        # Read the data
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
+        with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as xl:
+            # If sheet_name is not provided, list available sheets
+            if not sheet_name:
+                logger.info(f"Available sheets: {xl.sheet_names}")
+                sheet_name = xl.sheet_names[0]
+                logger.info(f"Using first sheet: {sheet_name}")
+                
+            # Read the data from the already opened workbook
+            df = xl.parse(sheet_name=sheet_name, header=None)
         logger.info(f"DataFrame shape: {df.shape}")
         
         # Print the first nrows rows
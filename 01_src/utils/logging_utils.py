@@ -1,8 +1,31 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 
+class _ProcessLocalQueueHandler(QueueHandler):
+    """
+    QueueHandler that only queues records in the process that created it.
+    
+    A forked worker process inherits the handler but not the listener thread, so
+    records put on the queue there would never be written. In any other process
+    the record is passed straight to the listener's handlers instead.
+    """
+    
+    def __init__(self, log_queue, listener):
+        super().__init__(log_queue)
+        self.listener = listener
+        self._pid = os.getpid()
+    
+    def emit(self, record):
+        if os.getpid() == self._pid:
+            super().emit(record)
+        else:
+            self.listener.handle(record)
+
 def setup_logger(script_name, log_directory="03_logs"):
     """
     Sets up a logger that writes to both console and a file.
@@ -12,8 +35,16 @@ def setup_logger(script_name, log_directory="03_logs"):
         log_directory (str): Directory where log files will be stored
     
     Returns:
-        logging.Logger: Configured logger instance
+        logging.Logger: Configured logger instance. Records are written by a
+        background QueueListener, available as logger.listener and stopped at exit.
+        In forked worker processes the inherited handlers write directly instead;
+        workers started with the spawn method get an unconfigured logger, as before.
     """
+    # Reuse the logger if it was already set up, instead of stacking a second set of handlers
+    logger = logging.getLogger(script_name)
+    if logger.handlers:
+        return logger
+    
     # Create logs directory if it doesn't exist
     log_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / log_directory
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -23,8 +54,6 @@ def setup_logger(script_name, log_directory="03_logs"):
     log_filename = f"{script_name}_{timestamp}.log"
     log_path = log_dir / log_filename
     
-    # Create logger
-    logger = logging.getLogger(script_name)
     logger.setLevel(logging.DEBUG)
     
     # Create formatters and handlers
@@ -45,8 +74,12 @@ def setup_logger(script_name, log_directory="03_logs"):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a background listener so file and console writes happen off the calling thread
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(_ProcessLocalQueueHandler(log_queue, listener))
+    logger.listener = listener
     
     return logger 
\ No newline at end of file